@@ -577,6 +577,7 @@ class Architecture(Summarizable):
         max_node_depth: int | None = None,
         node_filter: Callable[[str], bool] | None = None,
         communication_filter: Callable[[str], bool] | None = None,
+        max_paths: int | None = None,
     ) -> list[PathStructValue]:
         """
         Search for paths between specified nodes.
@@ -591,6 +592,8 @@ class Architecture(Summarizable):
             Node filter.
         communication_filter : Callable[[str], bool] | None
             Communication filter.
+        max_paths : int | None
+            Maximum number of paths to return. Defaults to None=unlimited (optional)
 
         Returns
         -------
@@ -632,7 +635,8 @@ class Architecture(Summarizable):
             communication_filter
         )
         paths = [v.to_value() for v in
-                 path_searcher.search(*node_names, max_node_depth=max_node_depth)]
+                 path_searcher.search(
+                     *node_names, max_node_depth=max_node_depth, max_paths=max_paths)]
 
         # Print message after search
         msg = f'A search up to depth {max_node_depth} has been completed. '
@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from collections.abc import Sequence
 from itertools import groupby, product
 from logging import getLogger, INFO
@@ -196,15 +197,25 @@ class CommValuesLoaded():
     ) -> None:
         node_values = nodes_loaded.data
 
-        data: list[CommunicationStruct] = []
-        pub_sub_pair = product(node_values, node_values)
+        # Index subscriptions by topic name so that each publisher only visits
+        # the subscriptions it can communicate with.
+        topic_to_subs: dict[str, list[tuple[int, int, NodeStruct, SubscriptionStruct]]]
+        topic_to_subs = defaultdict(list)
+        for node_sub_idx, node_sub in enumerate(node_values):
+            for sub_idx, sub in enumerate(node_sub.subscriptions):
+                topic_to_subs[sub.topic_name].append((node_sub_idx, sub_idx, node_sub, sub))
 
+        data: list[CommunicationStruct] = []
         node_pub: NodeStruct
-        node_sub: NodeStruct
-        for node_pub, node_sub in Progress.tqdm(pub_sub_pair, 'Searching communications.'):
-            for pub, sub in product(node_pub.publishers, node_sub.subscriptions):
-                if pub.topic_name != sub.topic_name:
-                    continue
+        for node_pub in Progress.tqdm(node_values, 'Searching communications.'):
+            pairs = []
+            for pub_idx, pub in enumerate(node_pub.publishers):
+                for node_sub_idx, sub_idx, node_sub, sub in topic_to_subs.get(pub.topic_name, []):
+                    pairs.append(((node_sub_idx, pub_idx, sub_idx), pub, node_sub, sub))
+
+            # Keep the subscription node, publisher, subscription order.
+            pairs.sort(key=lambda pair: pair[0])
+            for _, pub, node_sub, sub in pairs:
                 data.append(
                     self._to_struct(nodes_loaded, pub, sub, node_pub, node_sub)
                 )
@@ -1014,13 +1025,17 @@ class PublishersLoaded:
         node: NodeValue
     ) -> None:
         publisher_values = reader.get_publishers(node)
-        self._data = [self._to_struct(callbacks_loaded, pub)
+        callbacks = self._get_callbacks(callbacks_loaded)
+        topic_to_callbacks = self._get_topic_to_callbacks(callbacks)
+        self._data = [self._to_struct(callbacks_loaded, pub, callbacks, topic_to_callbacks)
                       for pub in publisher_values]
 
     @staticmethod
     def _to_struct(
         callbacks_loaded: CallbacksLoaded,
-        publisher_value: PublisherValue
+        publisher_value: PublisherValue,
+        callbacks: list[CallbackStruct],
+        topic_to_callbacks: dict[str, list[CallbackStruct]]
     ) -> PublisherStruct:
 
         pub_callbacks: list[CallbackStruct] = []
@@ -1032,19 +1047,13 @@ class PublishersLoaded:
                     callbacks_loaded.find_callback(callback_id))
 
         # May be assigned incorrectly for service or client-only nodes
-        callbacks = PublishersLoaded._get_callbacks(callbacks_loaded)
         srv_ignored_callbacks = [c for c in callbacks if not isinstance(c, ServiceCallbackStruct)]
         if len(pub_callbacks) == 0 and len(srv_ignored_callbacks) == 1:
             pub_callbacks.append(callbacks[0])
 
-        for callback in callbacks:
-            if callback.publish_topics is None or len(callback.publish_topics) == 0:
-                continue
-
-            for publish_topic in callback.publish_topics:
-                if publisher_value.topic_name == publish_topic.topic_name and \
-                        callback not in pub_callbacks:
-                    pub_callbacks.append(callback)
+        for callback in topic_to_callbacks.get(publisher_value.topic_name, []):
+            if callback not in pub_callbacks:
+                pub_callbacks.append(callback)
 
         return PublisherStruct(
             publisher_value.node_name,
@@ -1066,6 +1075,22 @@ class PublishersLoaded:
         callbacks = callbacks_loaded.data
         return Util.filter_items(is_user_defined, callbacks)
 
+    @staticmethod
+    def _get_topic_to_callbacks(
+        callbacks: list[CallbackStruct],
+    ) -> dict[str, list[CallbackStruct]]:
+        topic_to_callbacks: dict[str, list[CallbackStruct]] = defaultdict(list)
+        for callback in callbacks:
+            if callback.publish_topics is None:
+                continue
+
+            for publish_topic in callback.publish_topics:
+                topic_callbacks = topic_to_callbacks[publish_topic.topic_name]
+                # A callback may publish the same topic more than once.
+                if len(topic_callbacks) == 0 or topic_callbacks[-1] is not callback:
+                    topic_callbacks.append(callback)
+        return topic_to_callbacks
+
     @property
     def data(self) -> list[PublisherStruct]:
         """
@@ -1581,9 +1606,8 @@ class CallbacksLoaded():
     ) -> CallbackStruct:
 
         if isinstance(callback, TimerCallbackValue):
-            self._callback_count[callback] = self._callback_count.get(
+            callback_count = self._callback_count.setdefault(
                 callback, len(self._callback_count))
-            callback_count = self._callback_count[callback]
             indexed = indexed_name(
                 f'{self.node_name}/callback', callback_count, callback_num)
             callback_name = callback.callback_name or indexed
@@ -1599,9 +1623,8 @@ class CallbacksLoaded():
                 construction_order=callback.construction_order
             )
         if isinstance(callback, SubscriptionCallbackValue):
-            self._callback_count[callback] = self._callback_count.get(
+            callback_count = self._callback_count.setdefault(
                 callback, len(self._callback_count))
-            callback_count = self._callback_count[callback]
             indexed = indexed_name(
                 f'{self.node_name}/callback', callback_count, callback_num)
             callback_name = callback.callback_name or indexed
@@ -1619,9 +1642,8 @@ class CallbacksLoaded():
         # To avoid affecting exported files, special handling is done for service callbacks.
         # When the service is officially supported, the special processing will be removed.
         if isinstance(callback, ServiceCallbackValue):
-            self._srv_callback_count[callback] = self._srv_callback_count.get(
+            callback_count = self._srv_callback_count.setdefault(
                 callback, len(self._srv_callback_count))
-            callback_count = self._srv_callback_count[callback]
             indexed = indexed_name(
                 f'{self.node_name}/service_callback', callback_count, srv_callback_num)
             callback_name = callback.callback_name or indexed
@@ -1686,7 +1708,7 @@ class CallbacksLoaded():
             Failed to find callback.
 
         """
-        if callback_id in self._cb_dict.keys():
+        if callback_id in self._cb_dict:
             return self._cb_dict[callback_id]
 
         msg = 'Failed to find callback. '
@@ -1715,7 +1737,7 @@ class CallbacksLoaded():
         callbacks: list[CallbackStruct] = []
 
         for callback_id in callback_ids:
-            if callback_id not in self._cb_dict.keys():
+            if callback_id not in self._cb_dict:
                 continue
             callbacks.append(self.find_callback(callback_id))
 
@@ -14,10 +14,12 @@
 
 from __future__ import annotations
 
-from collections import defaultdict, UserList
-from collections.abc import Callable
-from itertools import product
+from collections import defaultdict
+from collections.abc import Callable, Iterator, Sequence
+from itertools import chain, islice, product
 from logging import getLogger
+import sys
+from typing import Any, NamedTuple
 
 from .struct import (CallbackStruct, CommunicationStruct,
                      NodePathStruct, NodeStruct,
@@ -25,7 +27,8 @@ from .struct import (CallbackStruct, CommunicationStruct,
                      SubscriptionStruct,
                      VariablePassingStruct)
 from ..common import Util
-from ..exceptions import (InvalidArgumentError, ItemNotFoundError)
+from ..exceptions import (InvalidArgumentError, ItemNotFoundError,
+                          MultipleItemFoundError)
 from ..value_objects.value_object import ValueObject
 
 logger = getLogger(__name__)
@@ -39,12 +42,16 @@ class GraphEdgeCore(ValueObject):
         self.label = label or ''
 
 
-class GraphPathCore(UserList):
+class GraphPathCore(list[GraphEdgeCore]):
 
     def __init__(self, init: list[GraphEdgeCore] | None = None):
         init = init or []
         super().__init__(init)
 
+    def __deepcopy__(self, memo: dict[int, Any]) -> GraphPathCore:
+        # Edges are never modified after being added to the graph, so they are shared.
+        return GraphPathCore(self)
+
     @property
     def path(self) -> tuple[GraphEdgeCore, ...]:
         """
@@ -56,7 +63,7 @@ class GraphPathCore(UserList):
             path.
 
         """
-        return tuple(self.data)
+        return tuple(self)
 
     def to_graph_node_indices(self) -> list[int]:
         """
@@ -83,13 +90,28 @@ class GraphPathCore(UserList):
         return nodes
 
 
+class GraphCsr(NamedTuple):
+    """Graph in compressed sparse row (CSR) form, stored as parallel lists."""
+
+    offsets: list[int]  # out-edges of node u are at offsets[u] until offsets[u + 1]
+    targets: list[int]  # end node index of each edge
+    pair_bits: list[int]  # bit shared by edges with the same start and end node
+    edges: list[GraphEdgeCore]
+
+
 class GraphCore:
 
     def __init__(self):
-        self._v = 0
         # default dictionary to store graph
         self._graph: defaultdict[int, list[GraphEdgeCore]]
         self._graph = defaultdict(list)
+        # default dictionary to store source indices of incoming edges
+        self._reverse_graph: defaultdict[int, list[int]]
+        self._reverse_graph = defaultdict(list)
+        # cache of nodes that can reach each end node, cleared when an edge is added
+        self._reachable_cache: dict[int, frozenset[int]] = {}
+        # compressed sparse row form of the graph, built for searches
+        self._csr: GraphCsr | None = None
 
     def add_edge(self, u: int, v: int, label: str | None = None):
         """
@@ -105,14 +127,76 @@ class GraphCore:
             label.
 
         """
-        self._v = max(self._v, u + 1, v + 1)
         self._graph[u].append(GraphEdgeCore(u, v, label))
+        self._reverse_graph[v].append(u)
+        self._reachable_cache.clear()
+        self._csr = None
+
+    def _get_csr(self) -> GraphCsr:
+        """
+        Get the graph in compressed sparse row (CSR) form.
+
+        Returns
+        -------
+        GraphCsr
+            Edges ordered by start index, then in the order they were added.
+            Nodes without out-edges beyond the last offset are omitted.
+
+        """
+        if self._csr is None:
+            csr = GraphCsr([0], [], [], [])
+            pair_ids: dict[tuple[int, int], int] = {}
+            for u in range(max(self._graph.keys(), default=-1) + 1):
+                for edge in self._graph.get(u, []):
+                    pair = (edge.i_from, edge.i_to)
+                    csr.targets.append(edge.i_to)
+                    csr.pair_bits.append(1 << pair_ids.setdefault(pair, len(pair_ids)))
+                    csr.edges.append(edge)
+                csr.offsets.append(len(csr.edges))
+            self._csr = csr
+        return self._csr
+
+    def _get_reachable_nodes(self, d: int) -> frozenset[int]:
+        """
+        Get nodes from which the given node can be reached.
+
+        Parameters
+        ----------
+        d : int
+            Index of the end node.
+
+        Returns
+        -------
+        frozenset[int]
+            Indices of nodes that have a path to d, including d itself.
+
+        Note
+        ----
+            The result is cached because searches over the same graph
+            often share the end node.
+
+        """
+        if d in self._reachable_cache:
+            return self._reachable_cache[d]
+
+        reachable = {d}
+        stack = [d]
+        while stack:
+            v = stack.pop()
+            for i in self._reverse_graph.get(v, []):
+                if i not in reachable:
+                    reachable.add(i)
+                    stack.append(i)
+
+        self._reachable_cache[d] = frozenset(reachable)
+        return self._reachable_cache[d]
 
     def search_paths(
         self,
         u: int,
         d: int,
-        max_depth: int = 0
+        max_depth: int = 0,
+        max_paths: int = 0
     ) -> list[GraphPathCore]:
         """
         Search for paths from the given start to end node using Depth First Search (DFS).
@@ -125,6 +209,9 @@ class GraphCore:
             Index of the end node
         max_depth : int
             Maximum depth of the search. Defaults to 0=unlimited (optional)
+        max_paths : int
+            Maximum number of paths to return. Defaults to 0=unlimited (optional)
+            The search stops as soon as this number of paths is found.
 
         Returns
         -------
@@ -132,63 +219,90 @@ class GraphCore:
             Returns list to all found paths.
 
         """
-        paths: list[GraphPathCore] = []        # for result
-        # Initialize visited node management
-        visited = [[False for _ in range(self._v)] for _ in range(self._v)]
-        edge: GraphEdgeCore | None = None      # Last edge used in the current search path
-        path: GraphPathCore = GraphPathCore()  # List to store the current search path
+        paths = self.iter_paths(u, d, max_depth)
+        if max_paths > 0:
+            return list(islice(paths, max_paths))
+        return list(paths)
+
+    def iter_paths(
+        self,
+        u: int,
+        d: int,
+        max_depth: int = 0
+    ) -> Iterator[GraphPathCore]:
+        """
+        Iterate over paths from the given start to end node using Depth First Search (DFS).
+
+        Paths are found lazily, in the same order as search_paths.
+
+        Parameters
+        ----------
+        u : int
+            Index of the start node
+        d : int
+            Index of the end node
+        max_depth : int
+            Maximum depth of the search. Defaults to 0=unlimited (optional)
+
+        Yields
+        ------
+        GraphPathCore
+            Found path.
+
+        """
+        # Edges towards nodes that cannot reach the end node are never searched.
+        reachable = self._get_reachable_nodes(d)
+        if u not in reachable:
+            return
+        # Bit mask of (from, to) index pairs already used in the current search path
+        visited = 0
+        # Edge positions in the CSR form of the current search path
+        path: list[int] = []
         has_max_depth = max_depth > 0
-        edges_cache = []
-        forward = True
         u_start = u
 
-        # Add the initial edge list.
-        current_edges = self._graph[u].copy()
-        edges_cache.append(current_edges)
-
-        while edges_cache:
-            if u == d and forward and path:
-                # If the goal is reached, record the path.
-                paths.append(path.copy())
-
-            # Get the next edge.
-            edge = None
-            if (u != d or u == u_start):
-                last_cache = edges_cache[-1]
-                if not (has_max_depth and len(path) > max_depth):
-                    idx = len(last_cache) - 1
-                    while idx >= 0:
-                        candidate_edge = last_cache[idx]
-                        i = candidate_edge.i_to
-                        if not visited[u][i]:
-                            edge = candidate_edge
-                            last_cache.pop(idx)
-                            break
-                        idx -= 1
-
-                    if edge is None:
-                        last_cache.clear()
-
-            if edge is not None:
-                # forward.
-                i = edge.i_to
-                visited[u][i] = True
-                u = i
-                path.append(edge)
-                current_edges = self._graph[u].copy()
-                edges_cache.append(current_edges)
-                forward = True  # Set the flag to forward.
-            else:
+        offsets, targets, pair_bits, edges = self._get_csr()
+        num_rows = len(offsets) - 1
+
+        def out_edge_positions(v: int) -> Iterator[int]:
+            # Edges are tried from the last added one.
+            if v >= num_rows:
+                return iter(())
+            return iter(range(offsets[v + 1] - 1, offsets[v] - 1, -1))
+
+        # Stack of iterators over the out-edges not yet tried for each node on the path.
+        stack: list[Iterator[int]] = [out_edge_positions(u)]
+
+        while stack:
+            pos = next(stack[-1], None)
+
+            if pos is None:
                 # backward.
-                forward = False  # Set the flag to backward.
-                edges_cache.pop()
+                stack.pop()
                 if path:
-                    last_edge = path.pop()
-                    u = last_edge.i_from
-                    i = last_edge.i_to
-                    visited[u][i] = False
+                    visited ^= pair_bits[path.pop()]
+                continue
 
-        return paths
+            i = targets[pos]
+            pair_bit = pair_bits[pos]
+            if i not in reachable or visited & pair_bit:
+                continue
+
+            # forward.
+            visited |= pair_bit
+            path.append(pos)
+
+            if i == d:
+                # If the goal is reached, yield the path.
+                yield GraphPathCore([edges[p] for p in path])
+
+            if (i == d and i != u_start) or (has_max_depth and len(path) > max_depth):
+                # Do not search beyond the goal or the maximum depth.
+                path.pop()
+                visited ^= pair_bit
+                continue
+
+            stack.append(out_edge_positions(i))
 
 
 class GraphNode(ValueObject):
@@ -196,6 +310,43 @@ class GraphNode(ValueObject):
     def __init__(self, node_name: str) -> None:
         self._node_name = node_name
 
+    def __eq__(self, other) -> bool:
+        """
+        Check whether self object equals to given instance.
+
+        Parameters
+        ----------
+        other : Any
+            Comparison target.
+
+        Returns
+        -------
+        bool
+            True if other is a GraphNode with the same node name. False otherwise.
+
+        """
+        # It is not necessary because __eq__ is defined in ValueObject type,
+        # but for speed, only the node name is compared.
+        if isinstance(other, GraphNode):
+            return self._node_name == other._node_name
+        return False
+
+    def __hash__(self) -> int:
+        """
+        Calculate hash value.
+
+        Returns
+        -------
+        int
+            A hash value calculated from the node name.
+
+        """
+        return hash(self._node_name)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> GraphNode:
+        # GraphNode is immutable, so it is returned as is.
+        return self
+
     @property
     def node_name(self) -> str:
         """
@@ -222,6 +373,45 @@ class GraphEdge(ValueObject):
         self._node_to = node_to
         self._label = label or ''
 
+    def __eq__(self, other) -> bool:
+        """
+        Check whether self object equals to given instance.
+
+        Parameters
+        ----------
+        other : Any
+            Comparison target.
+
+        Returns
+        -------
+        bool
+            True if other is a GraphEdge with the same nodes and label. False otherwise.
+
+        """
+        # It is not necessary because __eq__ is defined in ValueObject type,
+        # but for speed, only necessary items are compared.
+        if isinstance(other, GraphEdge):
+            return self._node_from == other._node_from and \
+                self._node_to == other._node_to and \
+                self._label == other._label
+        return False
+
+    def __hash__(self) -> int:
+        """
+        Calculate hash value.
+
+        Returns
+        -------
+        int
+            A hash value calculated from the nodes and label.
+
+        """
+        return hash((self._node_from, self._node_to, self._label))
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> GraphEdge:
+        # GraphEdge is immutable, so it is returned as is.
+        return self
+
     @property
     def label(self) -> str:
         """
@@ -288,12 +478,16 @@ class GraphEdge(ValueObject):
         return self.node_to.node_name
 
 
-class GraphPath(UserList):
+class GraphPath(list[GraphEdge]):
 
     def __init__(self, init: list[GraphEdge] | None = None):
         init = init or []
         super().__init__(init)
 
+    def __deepcopy__(self, memo: dict[int, Any]) -> GraphPath:
+        # GraphEdge is immutable, so edges are shared.
+        return GraphPath(self)
+
     @property
     def edges(self) -> list[GraphEdge]:
         """
@@ -305,7 +499,7 @@ class GraphPath(UserList):
             GraphEdge.
 
         """
-        return self.data
+        return self
 
     @property
     def nodes(self) -> list[GraphNode]:
@@ -392,7 +586,8 @@ class Graph:
     def search_paths(
         self,
         *nodes: GraphNode,
-        max_depth: int | None = None
+        max_depth: int | None = None,
+        max_paths: int | None = None
     ) -> list[GraphPath]:
         """
         Search paths.
@@ -403,6 +598,8 @@ class Graph:
             Nodes.
         max_depth : int | None
             Max depth.
+        max_paths : int | None
+            Maximum number of paths to return. Defaults to None=unlimited (optional)
 
         Returns
         -------
@@ -414,34 +611,80 @@ class Graph:
         InvalidArgumentError
             Occurs when there are 2 or fewer nodes.
 
+        """
+        paths = self.iter_paths(*nodes, max_depth=max_depth)
+        if max_paths is not None and max_paths > 0:
+            return list(islice(paths, max_paths))
+        return list(paths)
+
+    def iter_paths(
+        self,
+        *nodes: GraphNode,
+        max_depth: int | None = None
+    ) -> Iterator[GraphPath]:
+        """
+        Iterate over paths.
+
+        Paths are found lazily, in the same order as search_paths.
+        Only the segment between the first two nodes is searched lazily,
+        the following segments are searched before the first path is returned.
+
+        Parameters
+        ----------
+        nodes : GraphNode
+            Nodes.
+        max_depth : int | None
+            Max depth.
+
+        Returns
+        -------
+        Iterator[GraphPath]:
+            Iterator of searched Graph Path.
+
+        Raises
+        ------
+        InvalidArgumentError
+            Occurs when there are 2 or fewer nodes.
+
         """
         if len(nodes) < 2:
             raise InvalidArgumentError('nodes must be at least 2')
 
         self._validate(*nodes)
 
-        path_cores: list[list[GraphPathCore]] = []
-        for start, goal in zip(nodes[:-1], nodes[1:]):
-            path_cores.append(
-                self._graph.search_paths(
-                    self._node_to_idx[start],
-                    self._node_to_idx[goal],
-                    max_depth or 0
-                )
-            )
+        return self._iter_paths(*nodes, max_depth=max_depth)
 
-        paths: list[GraphPath] = []
-        for path_cores_ in product(*path_cores):
-            path = GraphPath()
+    def _iter_paths(
+        self,
+        *nodes: GraphNode,
+        max_depth: int | None = None
+    ) -> Iterator[GraphPath]:
+        # Edge cores are shared among found paths, so convert each of them only once.
+        edges: dict[int, GraphEdge] = {}
+
+        def to_edge(edge_core: GraphEdgeCore) -> GraphEdge:
+            key = id(edge_core)
+            if key not in edges:
+                node_from = self._idx_to_node[edge_core.i_from]
+                node_to = self._idx_to_node[edge_core.i_to]
+                edges[key] = GraphEdge(node_from, node_to, edge_core.label)
+            return edges[key]
+
+        def iter_segment(start: GraphNode, goal: GraphNode) -> Iterator[list[GraphEdge]]:
+            for path_core in self._graph.iter_paths(
+                self._node_to_idx[start],
+                self._node_to_idx[goal],
+                max_depth or 0
+            ):
+                yield [to_edge(edge_core) for edge_core in path_core]
 
-            for path_core in path_cores_:
-                for edge_core in path_core:
-                    node_from = self._idx_to_node[edge_core.i_from]
-                    node_to = self._idx_to_node[edge_core.i_to]
-                    path.append(GraphEdge(node_from, node_to, edge_core.label))
-            paths.append(path)
+        tail_segments: list[list[list[GraphEdge]]] = [
+            list(iter_segment(start, goal)) for start, goal in zip(nodes[1:-1], nodes[2:])
+        ]
 
-        return paths
+        for head_segment in iter_segment(nodes[0], nodes[1]):
+            for tail_segments_ in product(*tail_segments):
+                yield GraphPath(list(chain(head_segment, *tail_segments_)))
 
 
 class CallbackPathSearcher:
@@ -453,6 +696,14 @@ class CallbackPathSearcher:
         max_callback_construction_order: int
     ) -> None:
         self._node = node
+        # Lookup tables used to restore paths, built on first use.
+        self._callbacks_dict: defaultdict[str, list[CallbackStruct]] | None = None
+        self._var_passes_dict: defaultdict[
+            tuple[str | None, str | None], list[VariablePassingStruct]] | None = None
+        # Callbacks and variable passings restored from each sequence of graph node names.
+        # The same graph path is restored once for every end callback publisher.
+        self._child_cache: dict[
+            tuple[str, ...], tuple[CallbackStruct | VariablePassingStruct, ...]] = {}
 
         callbacks = node.callbacks
         var_passes = node.variable_passings
@@ -462,19 +713,47 @@ class CallbackPathSearcher:
 
         self._graph = Graph()
 
+        for point_name_from, point_name_to in self._to_edge_point_names(
+            callbacks, var_passes, max_callback_construction_order
+        ):
+            self._graph.add_edge(GraphNode(point_name_from), GraphNode(point_name_to))
+
+    @staticmethod
+    def _to_edge_point_names(
+        callbacks: Sequence[CallbackStruct],
+        var_passes: Sequence[VariablePassingStruct],
+        max_callback_construction_order: int
+    ) -> Iterator[tuple[str, str]]:
+        """
+        Get graph edges as pairs of node point names.
+
+        Parameters
+        ----------
+        callbacks : Sequence[CallbackStruct]
+            Callbacks of the node. Each becomes a read to write edge.
+        var_passes : Sequence[VariablePassingStruct]
+            Variable passings of the node. Each becomes a write to read edge.
+        max_callback_construction_order : int
+            Callbacks with a larger construction order are skipped. 0 means unlimited.
+
+        Yields
+        ------
+        tuple[str, str]
+            Point names of the start and end of the edge.
+
+        """
+        to_point_name = CallbackPathSearcher._to_node_point_name
+
         for callback in callbacks:
             if callback.callback_name is None or (
                 max_callback_construction_order != 0 and
                 callback.construction_order > max_callback_construction_order
             ):
                 continue
+            yield (to_point_name(callback.callback_name, 'read'),
+                   to_point_name(callback.callback_name, 'write'))
 
-            write_name = self._to_node_point_name(callback.callback_name, 'write')
-            read_name = self._to_node_point_name(callback.callback_name, 'read')
-
-            self._graph.add_edge(GraphNode(read_name), GraphNode(write_name))
-
-        callback_names = [callback.callback_name for callback in callbacks]
+        callback_names = {callback.callback_name for callback in callbacks}
 
         for var_pass in var_passes:
             if var_pass.callback_name_read is None or \
@@ -483,17 +762,15 @@ class CallbackPathSearcher:
             if var_pass.callback_name_write is None or \
                     var_pass.callback_name_write not in callback_names:
                 continue
-
-            write_name = self._to_node_point_name(var_pass.callback_name_write, 'write')
-            read_name = self._to_node_point_name(var_pass.callback_name_read, 'read')
-
-            self._graph.add_edge(GraphNode(write_name), GraphNode(read_name))
+            yield (to_point_name(var_pass.callback_name_write, 'write'),
+                   to_point_name(var_pass.callback_name_read, 'read'))
 
     def search(
         self,
         start_callback: CallbackStruct,
         end_callback: CallbackStruct,
-        node: NodeStruct
+        node: NodeStruct,
+        max_paths: int | None = None
     ) -> tuple[NodePathStruct, ...]:
         """
         Search paths.
@@ -506,6 +783,8 @@ class CallbackPathSearcher:
             end callback.
         node : NodeStruct
             node.
+        max_paths : int | None
+            Maximum number of paths to return. Defaults to None=unlimited (optional)
 
         Returns
         -------
@@ -521,12 +800,16 @@ class CallbackPathSearcher:
         end_name = self._to_node_point_name(
             end_callback.callback_name, 'write')
 
-        graph_paths = self._graph.search_paths(GraphNode(start_name), GraphNode(end_name))
+        graph_paths = self._graph.search_paths(
+            GraphNode(start_name), GraphNode(end_name), max_paths=max_paths)
+        if len(graph_paths) == 0:
+            return ()
+
+        subscription = node.get_subscription_from_callback(start_callback.callback_name)
+        publisher = node.get_publisher_from_callback(end_callback.callback_name)
 
         paths: list[NodePathStruct] = []
         for graph_path in graph_paths:
-            subscription = node.get_subscription_from_callback(start_callback.callback_name)
-            publisher = node.get_publisher_from_callback(end_callback.callback_name)
             paths += self._to_paths(
                 graph_path,
                 subscription,
@@ -563,15 +846,16 @@ class CallbackPathSearcher:
         subscription: SubscriptionStruct | None,
         publisher: PublisherStruct | None
     ) -> NodePathStruct:
-        child: list[CallbackStruct | VariablePassingStruct] = []
-
-        graph_nodes = callbacks_graph_path.nodes
-        graph_node_names = [_.node_name for _ in graph_nodes]
+        graph_node_names = tuple(_.node_name for _ in callbacks_graph_path.nodes)
 
-        for graph_node_from, graph_node_to in zip(graph_node_names[:-1], graph_node_names[1:]):
-            cb_or_varpass = self._find_cb_or_varpass(
-                graph_node_from, graph_node_to)
-            child.append(cb_or_varpass)
+        if graph_node_names not in self._child_cache:
+            self._child_cache[graph_node_names] = tuple(
+                self._find_cb_or_varpass(graph_node_from, graph_node_to)
+                for graph_node_from, graph_node_to
+                in zip(graph_node_names[:-1], graph_node_names[1:])
+            )
+        child: list[CallbackStruct | VariablePassingStruct] = \
+            list(self._child_cache[graph_node_names])
 
         return NodePathStruct(
             self._node.node_name,
@@ -602,43 +886,46 @@ class CallbackPathSearcher:
         graph_node_from: str,
         graph_node_to: str,
     ) -> VariablePassingStruct:
-
-        def is_target(var_pass:  VariablePassingStruct):
-            if graph_node_to is not None:
-                read_cb_name = self._point_name_to_callback_name(graph_node_to)
-                read_cb_match = var_pass.callback_name_read == read_cb_name
-
-            if graph_node_from is not None:
-                write_cb_name = self._point_name_to_callback_name(
-                    graph_node_from)
-                write_cb_match = var_pass.callback_name_write == write_cb_name
-
-            if read_cb_match is None and write_cb_match is None:
-                return False
-
-            return read_cb_match and write_cb_match
-
-        try:
-            return Util.find_one(is_target, self._node.variable_passings)
-        except ItemNotFoundError:
-            pass
-        raise ItemNotFoundError('')
+        if self._var_passes_dict is None:
+            self._var_passes_dict = defaultdict(list)
+            for var_pass in self._node.variable_passings or []:
+                key = (var_pass.callback_name_write, var_pass.callback_name_read)
+                self._var_passes_dict[key].append(var_pass)
+
+        write_cb_name = self._point_name_to_callback_name(graph_node_from)
+        read_cb_name = self._point_name_to_callback_name(graph_node_to)
+        var_passes = self._var_passes_dict.get((write_cb_name, read_cb_name), [])
+
+        if len(var_passes) == 0:
+            raise ItemNotFoundError('')
+        if len(var_passes) >= 2:
+            raise MultipleItemFoundError('Failed to identify item.')
+        return var_passes[0]
 
     def _find_cb(
         self,
         graph_node_from: str,
         graph_node_to: str,
     ) -> CallbackStruct:
-        def is_target(callback: CallbackStruct):
-            callback_name = self._point_name_to_callback_name(graph_node_from)
-            return callback.callback_name == callback_name
+        if self._callbacks_dict is None:
+            self._callbacks_dict = defaultdict(list)
+            for callback in self._node.callbacks or []:
+                self._callbacks_dict[callback.callback_name].append(callback)
+
+        callback_name = self._point_name_to_callback_name(graph_node_from)
+        callbacks = self._callbacks_dict.get(callback_name, [])
 
-        callbacks = self._node.callbacks
-        return Util.find_one(is_target, callbacks)
+        if len(callbacks) == 0:
+            raise ItemNotFoundError('Failed find item.')
+        if len(callbacks) >= 2:
+            raise MultipleItemFoundError('Failed to identify item.')
+        return callbacks[0]
 
     @staticmethod
     def _to_node_point_name(callback_name: str, read_or_write: str) -> str:
-        return f'{callback_name}@{read_or_write}'
+        # Point names are built on every search and used as graph node keys,
+        # so intern them to let dictionary lookups match by identity.
+        return sys.intern(f'{callback_name}@{read_or_write}')
 
     @staticmethod
     def _point_name_to_callback_name(point_name: str) -> str:
@@ -679,6 +966,10 @@ class NodePathSearcher:
         self._nodes = nodes
         self._comms = communications
 
+        self._nodes_dict: defaultdict[str, list[NodeStruct]] = defaultdict(list)
+        for node in nodes:
+            self._nodes_dict[node.node_name].append(node)
+
         self._graph = Graph()
 
         self._node_path_dict: dict[NodePathKey, NodePathStruct] = {}
@@ -798,7 +1089,8 @@ class NodePathSearcher:
     def search(
         self,
         *node_names: str,
-        max_node_depth: int | None = None
+        max_node_depth: int | None = None,
+        max_paths: int | None = None
     ) -> list[PathStruct]:
         """
         Search paths.
@@ -809,6 +1101,8 @@ class NodePathSearcher:
             Node names.
         max_node_depth : int | None
             Max node depth.
+        max_paths : int | None
+            Maximum number of paths to return. Defaults to None=unlimited (optional)
 
         Returns
         -------
@@ -823,7 +1117,8 @@ class NodePathSearcher:
         graph_nodes: list[GraphNode] = [GraphNode(node) for node in node_names]
         graph_paths = self._graph.search_paths(
             *graph_nodes,
-            max_depth=max_search_depth)
+            max_depth=max_search_depth,
+            max_paths=max_paths)
 
         for graph_path in graph_paths:
             paths.append(self._to_path(graph_path))
@@ -831,38 +1126,45 @@ class NodePathSearcher:
         return paths
 
     def _find_node(self, node_name: str) -> NodeStruct:
-        try:
-            return Util.find_one(lambda x: x.node_name == node_name, self._nodes)
-        except ItemNotFoundError:
+        return self._find_node_from_dict(self._nodes_dict, node_name)
+
+    @staticmethod
+    def _find_node_from_dict(
+        nodes: dict[str, list[NodeStruct]],
+        node_name: str
+    ) -> NodeStruct:
+        matched = nodes.get(node_name, [])
+        if len(matched) == 0:
             msg = 'Failed to find node. '
             msg += f'node_name: {node_name}. '
             raise ItemNotFoundError(msg)
+        if len(matched) >= 2:
+            raise MultipleItemFoundError('Failed to identify item.')
+        return matched[0]
 
     @staticmethod
     def _get_publisher(
-        nodes: tuple[NodeStruct, ...],
+        nodes: dict[str, list[NodeStruct]],
         node_name: str,
         topic_name: str,
         construction_order: int | None,
     ) -> PublisherStruct:
-        node: NodeStruct
-        node = Util.find_one(lambda x: x.node_name == node_name, nodes)
+        node = NodePathSearcher._find_node_from_dict(nodes, node_name)
         return node.get_publisher(topic_name, construction_order)
 
     @staticmethod
     def _get_subscription(
-        nodes: tuple[NodeStruct, ...],
+        nodes: dict[str, list[NodeStruct]],
         node_name: str,
         topic_name: str,
         construction_order: int | None
     ) -> SubscriptionStruct:
-        node: NodeStruct
-        node = Util.find_one(lambda x: x.node_name == node_name, nodes)
+        node = NodePathSearcher._find_node_from_dict(nodes, node_name)
         return node.get_subscription(topic_name, construction_order)
 
     @staticmethod
     def _create_head_dummy_node_path(
-        nodes: tuple[NodeStruct, ...],
+        nodes: dict[str, list[NodeStruct]],
         node_name: str,
         topic_name: str,
         construction_order: int | None
@@ -877,7 +1179,7 @@ class NodePathSearcher:
 
     @staticmethod
     def _create_tail_dummy_node_path(
-        nodes: tuple[NodeStruct, ...],
+        nodes: dict[str, list[NodeStruct]],
         node_name: str,
         topic_name: str,
         subscription_construct_order: int | None
@@ -910,7 +1212,7 @@ class NodePathSearcher:
         topic_name, sub_const, pub_const_order = parse_comm_edge(node_graph_path.edges[0].label)
 
         head_node_path = self._create_head_dummy_node_path(
-            self._nodes,
+            self._nodes_dict,
             node_graph_path.edges[0].node_name_from,
             topic_name,
             pub_const_order
@@ -953,7 +1255,7 @@ class NodePathSearcher:
 
         # add tail NodePath
         tail_node_path = self._create_tail_dummy_node_path(
-            self._nodes,
+            self._nodes_dict,
             tail_edge.node_name_to,
             topic_name,
             sub_const
@@ -109,3 +109,24 @@ class ClockConverter():
         """
         converted = self._a * time + self._b
         return converted
+
+    def convert_array(
+        self,
+        times: np.ndarray
+    ) -> np.ndarray:
+        """
+        Convert input times at once.
+
+        Parameters
+        ----------
+        times : np.ndarray
+            Times to convert.
+
+        Returns
+        -------
+        np.ndarray
+            Times after conversion.
+            Conversion are done with y=ax+b for each element.
+
+        """
+        return self._a * times + self._b
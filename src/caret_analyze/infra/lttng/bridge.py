@@ -14,6 +14,9 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
+from functools import lru_cache
+
 from .lttng import Lttng
 from .value_objects import (PublisherValueLttng,
                             SubscriptionCallbackValueLttng,
@@ -147,8 +150,8 @@ class LttngBridge:
         """
         try:
             condition = PublisherBindCondition(publisher_value)
-            node = NodeValue(publisher_value.node_name, None)
-            pubs = self._lttng.get_publishers(node)
+            pubs = self._get_publishers_by_topic(publisher_value.node_name).get(
+                (publisher_value.topic_name, publisher_value.construction_order), [])
             pubs_filtered = Util.filter_items(condition, pubs)
         except ItemNotFoundError:
             msg = 'Failed to find publisher instance. '
@@ -157,6 +160,16 @@ class LttngBridge:
 
         return pubs_filtered
 
+    @lru_cache
+    def _get_publishers_by_topic(
+        self,
+        node_name: str
+    ) -> dict[tuple[str, int], list[PublisherValueLttng]]:
+        pubs: dict[tuple[str, int], list[PublisherValueLttng]] = defaultdict(list)
+        for pub in self._lttng.get_publishers(NodeValue(node_name, None)):
+            pubs[(pub.topic_name, pub.construction_order)].append(pub)
+        return pubs
+
 
 class TimerCallbackBindCondition:
     """
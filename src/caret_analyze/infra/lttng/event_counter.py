@@ -14,6 +14,8 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from logging import getLogger
 
 import pandas as pd
@@ -40,7 +42,17 @@ class EventCounter:
             raise InvalidArgumentError(
                 f'invalid groupby: {groupby}. {self._allowed_keys} are allowed.')
 
-        grouped_df = self._count_df.groupby(groupby).sum([['size']])
+        return self._get_count(tuple(groupby)).copy()
+
+    @lru_cache
+    def _get_count(self, groupby: tuple[str, ...]) -> pd.DataFrame:
+        grouped_df = self._count_df.groupby(list(groupby), observed=True).sum([['size']])
+        # The categoricals are internal to the count table; return plain string keys.
+        index = grouped_df.index
+        if isinstance(index, pd.MultiIndex):
+            grouped_df.index = index.set_levels([level.astype(object) for level in index.levels])
+        else:
+            grouped_df.index = index.astype(object)
         count_df = grouped_df.sort_values('size', ascending=False)
         return count_df
 
@@ -52,7 +64,7 @@ class EventCounter:
         ignored_topics = ['caret/start_record', '/caret/end_record']
         ignored_df = record_df[~record_df['topic_name'].isin(ignored_topics)]
 
-        count_df = ignored_df.groupby('trace_point').sum([['size']])
+        count_df = ignored_df.groupby('trace_point', observed=True, sort=False).sum([['size']])
         count_df_recorded = count_df[count_df['size'] > 0]
         recorded_trace_points = list(count_df_recorded.index)
 
@@ -247,56 +259,59 @@ class EventCounter:
             else:
                 return ns + '/' + name
 
-        for handler, row in data.nodes.df.iterrows():
-            node_handle_to_node_name[handler] = ns_and_node_name(row['namespace'], row['name'])
-
-        for handler, row in data.publishers.df.iterrows():
-            pub_handle_to_node_name[handler] = \
-                node_handle_to_node_name.get(row['node_handle'], '-')
-            pub_handle_to_topic_name[handler] = row['topic_name']
-
-        for handler, row in data.subscriptions.df.iterrows():
-            sub_handle_to_node_name[handler] = \
-                node_handle_to_node_name.get(row['node_handle'], '-')
-            sub_handle_to_topic_name[handler] = row['topic_name']
-            rmw_handle_to_node_name[row['rmw_handle']] = \
-                node_handle_to_node_name.get(row['node_handle'], '-')
-            rmw_handle_to_topic_name[row['rmw_handle']] = row['topic_name']
-
-        for handler, row in data.timer_node_links.df.iterrows():
-            timer_handle_to_node_name[handler] = \
-                node_handle_to_node_name.get(row['node_handle'], '-')
-
-        for sub, row in data.subscription_objects.df.iterrows():
-            sub_handle = row['subscription_handle']
+        nodes_df = data.nodes.df
+        for handler, ns, name in zip(nodes_df.index, nodes_df['namespace'], nodes_df['name']):
+            node_handle_to_node_name[handler] = ns_and_node_name(ns, name)
+
+        pubs_df = data.publishers.df
+        for handler, node_handle, topic_name in zip(
+                pubs_df.index, pubs_df['node_handle'], pubs_df['topic_name']):
+            pub_handle_to_node_name[handler] = node_handle_to_node_name.get(node_handle, '-')
+            pub_handle_to_topic_name[handler] = topic_name
+
+        subs_df = data.subscriptions.df
+        for handler, node_handle, topic_name, rmw_handle in zip(
+                subs_df.index, subs_df['node_handle'], subs_df['topic_name'],
+                subs_df['rmw_handle']):
+            sub_handle_to_node_name[handler] = node_handle_to_node_name.get(node_handle, '-')
+            sub_handle_to_topic_name[handler] = topic_name
+            rmw_handle_to_node_name[rmw_handle] = node_handle_to_node_name.get(node_handle, '-')
+            rmw_handle_to_topic_name[rmw_handle] = topic_name
+
+        timer_node_links_df = data.timer_node_links.df
+        for handler, node_handle in zip(
+                timer_node_links_df.index, timer_node_links_df['node_handle']):
+            timer_handle_to_node_name[handler] = node_handle_to_node_name.get(node_handle, '-')
+
+        sub_objects_df = data.subscription_objects.df
+        for sub, sub_handle in zip(
+                sub_objects_df.index, sub_objects_df['subscription_handle']):
             sub_to_topic_name[sub] = sub_handle_to_topic_name.get(sub_handle, '-')
             sub_to_node_name[sub] = sub_handle_to_node_name.get(sub_handle, '-')
 
-        for handler, row in data.callback_objects.df.iterrows():
+        callback_objects_df = data.callback_objects.df
+        for handler, callback_object in zip(
+                callback_objects_df.index, callback_objects_df['callback_object']):
             if handler in sub_to_topic_name:
-                sub_cb_to_node_name[row['callback_object']] = sub_to_node_name.get(handler, '-')
-                sub_cb_to_topic_name[row['callback_object']] = sub_to_topic_name.get(handler, '-')
+                sub_cb_to_node_name[callback_object] = sub_to_node_name.get(handler, '-')
+                sub_cb_to_topic_name[callback_object] = sub_to_topic_name.get(handler, '-')
             elif handler in timer_handle_to_node_name:
-                timer_cb_to_node_name[row['callback_object']] = \
+                timer_cb_to_node_name[callback_object] = \
                     timer_handle_to_node_name.get(handler, '-')
 
-        tilde_pub_to_topic_name: dict[int, str] = {}
-        tilde_pub_to_node_name: dict[int, str] = {}
-        for handler, row in data.tilde_publishers.df.iterrows():
-            tilde_pub_to_node_name[handler] = row['node_name']
-            tilde_pub_to_topic_name[handler] = row['topic_name']
+        tilde_pubs_df = data.tilde_publishers.df
+        tilde_pub_to_topic_name: dict[int, str] = dict(
+            zip(tilde_pubs_df.index, tilde_pubs_df['topic_name']))
+        tilde_pub_to_node_name: dict[int, str] = dict(
+            zip(tilde_pubs_df.index, tilde_pubs_df['node_name']))
 
-        tilde_sub_to_topic_name: dict[int, str] = {}
-        tilde_sub_to_node_name: dict[int, str] = {}
-        for handler, row in data.tilde_subscriptions.df.iterrows():
-            tilde_sub_to_node_name[handler] = row['node_name']
-            tilde_sub_to_topic_name[handler] = row['topic_name']
+        tilde_subs_df = data.tilde_subscriptions.df
+        tilde_sub_to_topic_name: dict[int, str] = dict(
+            zip(tilde_subs_df.index, tilde_subs_df['topic_name']))
+        tilde_sub_to_node_name: dict[int, str] = dict(
+            zip(tilde_subs_df.index, tilde_subs_df['node_name']))
 
         count_dict = []
-        group_keys = [
-            'callback_object', 'publisher_handle', 'subscription_handle',
-            'tilde_publisher', 'tilde_subscription', 'rmw_subscription_handle'
-        ]
         for trace_point, df in trace_point_and_df.items():
             df = df.reset_index()
 
@@ -310,63 +325,78 @@ class EventCounter:
                     }
                 )
                 continue
-            if 'callback_object' not in df.columns:
-                df['callback_object'] = '-'
-            if 'publisher_handle' not in df.columns:
-                df['publisher_handle'] = '-'
-            if 'subscription_handle' not in df.columns:
-                df['subscription_handle'] = '-'
-            if 'rmw_subscription_handle' not in df.columns:
-                df['rmw_subscription_handle'] = '-'
 
+            # Group only by the handle columns this trace point has, so that the
+            # group keys keep their integer dtype instead of mixing in placeholders.
+            key_columns = {
+                column: column
+                for column in ['callback_object', 'publisher_handle', 'subscription_handle',
+                               'rmw_subscription_handle']
+                if column in df.columns
+            }
             if trace_point in ['ros2_caret:tilde_publish', 'ros2_caret:tilde_publisher_init']:
-                df['tilde_publisher'] = df['publisher']
-            else:
-                df['tilde_publisher'] = '-'
-
+                key_columns['tilde_publisher'] = 'publisher'
             if trace_point in ['ros2_caret:tilde_subscribe', 'ros2_caret:tilde_subscription_init']:
-                df['tilde_subscription'] = df['subscription']
+                key_columns['tilde_subscription'] = 'subscription'
+
+            # Only the size of each group is used, so count rows without building
+            # a frame per group.
+            if len(key_columns) == 0:
+                group_sizes = [((), len(df))]
             else:
-                df['tilde_subscription'] = '-'
+                group_sizes = df.groupby(list(key_columns.values()), sort=False).size().items()
+
+            for key, size in group_sizes:
+                if not isinstance(key, tuple):
+                    key = (key,)
+                handles: dict[str, int] = dict(zip(key_columns, key))
+                callback_object = handles.get('callback_object')
+                publisher_handle = handles.get('publisher_handle')
+                subscription_handle = handles.get('subscription_handle')
+                tilde_publisher = handles.get('tilde_publisher')
+                tilde_subscription = handles.get('tilde_subscription')
+                rmw_subscription_handle = handles.get('rmw_subscription_handle')
 
-            for key, group in df.groupby(group_keys):
                 node_name = '-'
                 topic_name = '-'
 
-                if key[0] in timer_cb_to_node_name:
-                    node_name = timer_cb_to_node_name.get(key[0], '-')
-                elif key[0] in sub_cb_to_node_name or key[0] \
+                if callback_object in timer_cb_to_node_name:
+                    node_name = timer_cb_to_node_name.get(callback_object, '-')
+                elif callback_object in sub_cb_to_node_name or callback_object \
                         in sub_cb_to_topic_name:
-                    node_name = sub_cb_to_node_name.get(key[0], '-')
-                    topic_name = sub_cb_to_topic_name.get(key[0], '-')
-                elif key[1] in pub_handle_to_topic_name or \
-                        key[1] in pub_handle_to_node_name:
-                    topic_name = pub_handle_to_topic_name.get(key[1], '-')
-                    node_name = pub_handle_to_node_name.get(key[1], '-')
-                elif key[2] in sub_handle_to_node_name or \
-                        key[2] in sub_handle_to_topic_name:
-                    topic_name = sub_handle_to_topic_name.get(key[2], '-')
-                    node_name = sub_handle_to_node_name.get(key[2], '-')
-                elif key[3] in tilde_pub_to_node_name or \
-                        key[3] in tilde_pub_to_topic_name:
-                    topic_name = tilde_pub_to_topic_name.get(key[3], '-')
-                    node_name = tilde_pub_to_node_name.get(key[3], '-')
-                elif key[4] in tilde_sub_to_node_name or \
-                        key[4] in tilde_sub_to_topic_name:
-                    topic_name = tilde_sub_to_topic_name.get(key[4], '-')
-                    node_name = tilde_sub_to_node_name.get(key[4], '-')
-                elif key[5] in rmw_handle_to_node_name or \
-                        key[5] in rmw_handle_to_topic_name:
-                    topic_name = rmw_handle_to_topic_name.get(key[5], '-')
-                    node_name = rmw_handle_to_node_name.get(key[5], '-')
+                    node_name = sub_cb_to_node_name.get(callback_object, '-')
+                    topic_name = sub_cb_to_topic_name.get(callback_object, '-')
+                elif publisher_handle in pub_handle_to_topic_name or \
+                        publisher_handle in pub_handle_to_node_name:
+                    topic_name = pub_handle_to_topic_name.get(publisher_handle, '-')
+                    node_name = pub_handle_to_node_name.get(publisher_handle, '-')
+                elif subscription_handle in sub_handle_to_node_name or \
+                        subscription_handle in sub_handle_to_topic_name:
+                    topic_name = sub_handle_to_topic_name.get(subscription_handle, '-')
+                    node_name = sub_handle_to_node_name.get(subscription_handle, '-')
+                elif tilde_publisher in tilde_pub_to_node_name or \
+                        tilde_publisher in tilde_pub_to_topic_name:
+                    topic_name = tilde_pub_to_topic_name.get(tilde_publisher, '-')
+                    node_name = tilde_pub_to_node_name.get(tilde_publisher, '-')
+                elif tilde_subscription in tilde_sub_to_node_name or \
+                        tilde_subscription in tilde_sub_to_topic_name:
+                    topic_name = tilde_sub_to_topic_name.get(tilde_subscription, '-')
+                    node_name = tilde_sub_to_node_name.get(tilde_subscription, '-')
+                elif rmw_subscription_handle in rmw_handle_to_node_name or \
+                        rmw_subscription_handle in rmw_handle_to_topic_name:
+                    topic_name = rmw_handle_to_topic_name.get(rmw_subscription_handle, '-')
+                    node_name = rmw_handle_to_node_name.get(rmw_subscription_handle, '-')
 
                 count_dict.append(
                     {
                         'node_name': node_name,
                         'topic_name': topic_name,
-                        'size': len(group),
+                        'size': size,
                         'trace_point': trace_point
                     }
                 )
 
-        return pd.DataFrame.from_dict(count_dict)
+        count_df = pd.DataFrame.from_dict(count_dict)
+        # Names repeat across many rows and are only used as groupby keys.
+        return count_df.astype(
+            {'node_name': 'category', 'topic_name': 'category', 'trace_point': 'category'})
@@ -62,16 +62,20 @@ class EventCollection(Iterable, Sized):
 
         self._iterable_events: IterableEvents
         cache_path = self._cache_path(trace_dir)
-        use_cache = False
+        cache: PickleEventCollection | None = None
 
         if self._cache_exists(cache_path) and not force_conversion:
-            cache_start_time, _ = PickleEventCollection(cache_path).time_range()
-            ctf_start_time, _ = CtfEventCollection(trace_dir).time_range()
-            use_cache = cache_start_time == ctf_start_time
-
-        if use_cache:
+            cache = PickleEventCollection(cache_path)
+            cache_start_time, _ = cache.time_range()
+            # Only the first event is needed to validate the cache,
+            # so the whole trace is not scanned here.
+            ctf_start_time = CtfEventCollection.read_begin_time(trace_dir)
+            if cache_start_time != ctf_start_time:
+                cache = None
+
+        if cache is not None:
             logger.info('Found converted file.')
-            self._iterable_events = PickleEventCollection(cache_path)
+            self._iterable_events = cache
         else:
             self._iterable_events = CtfEventCollection(trace_dir)
             if store_cache:
@@ -218,6 +222,31 @@ class CtfEventCollection(IterableEvents):
         self._size = event_count
         self._events_path = events_path
 
+    @staticmethod
+    def read_begin_time(events_path: str) -> int:
+        """
+        Read the timestamp of the first event without scanning the whole trace.
+
+        Parameters
+        ----------
+        events_path : str
+            Path to trace dir.
+
+        Returns
+        -------
+        int
+            Timestamp of the first event.
+
+        """
+        begin_msg: Any = None
+        for msg in bt2.TraceCollectionMessageIterator(events_path):
+            if type(msg) is bt2._EventMessageConst:
+                begin_msg = msg
+                break
+
+        assert begin_msg is not None
+        return begin_msg.default_clock_snapshot.ns_from_origin
+
     def __iter__(self) -> Iterator[dict]:
         return iter(self.events)
 
@@ -303,7 +332,6 @@ class Lttng(InfraBase):
     """
     Lttng data container class.
 
-    This class is a singleton in order to retain information.
     The main processing is done by LttngInfo and RecordsSource.
 
     """
@@ -51,32 +51,14 @@ class LttngInfo:
         self._rmw_implementation = data.rmw_impl.iat(0, 0) if len(data.rmw_impl) > 0 else ''
         self._distribution = self._get_distribution(data)
 
-        self._id_to_topic: dict[str, str] = {}
-        self._id_to_service: dict[str, str] = {}
-
     def _get_timer_cbs_without_pub(self, node_id: str) -> list[TimerCallbackValueLttng]:
-        timer_cb_cache_without_pub = self._load_timer_cbs_without_pub()
-
-        if node_id not in timer_cb_cache_without_pub:
-            return []
-
-        return timer_cb_cache_without_pub[node_id]
+        return self._load_timer_cbs_without_pub().get(node_id, [])
 
     def _get_sub_cbs_without_pub(self, node_id: str) -> list[SubscriptionCallbackValueLttng]:
-        sub_cb_cache_without_pub = self._load_sub_cbs_without_pub()
-
-        if node_id not in sub_cb_cache_without_pub:
-            return []
-
-        return sub_cb_cache_without_pub[node_id]
+        return self._load_sub_cbs_without_pub().get(node_id, [])
 
     def _get_srv_cbs_without_pub(self, node_id: str) -> list[ServiceCallbackValueLttng]:
-        srv_cb_cache_without_pub = self._load_srv_cbs_without_pub()
-
-        if node_id not in srv_cb_cache_without_pub:
-            return []
-
-        return srv_cb_cache_without_pub[node_id]
+        return self._load_srv_cbs_without_pub().get(node_id, [])
 
     def get_rmw_impl(self) -> str:
         """
@@ -124,20 +106,24 @@ class LttngInfo:
         nodes = self._formatted.nodes.clone()
         merge(timer_callbacks, nodes, 'node_handle')
 
-        for _, row in timer_callbacks.df.iterrows():
-            node_name = row['node_name']
-            node_id = row['node_id']
+        columns = [
+            'callback_id', 'node_name', 'node_id', 'symbol', 'period_ns',
+            'timer_handle', 'callback_object', 'construction_order'
+        ]
+        for (callback_id, node_name, node_id, symbol, period_ns,
+             timer_handle, callback_object, construction_order) \
+                in timer_callbacks.df[columns].itertuples(index=False, name=None):
             timer_cbs_info[node_id].append(
                 TimerCallbackValueLttng(
-                    callback_id=row['callback_id'],
+                    callback_id=callback_id,
                     node_name=node_name,
-                    node_id=row['node_id'],
-                    symbol=row['symbol'],
-                    period_ns=row['period_ns'],
-                    timer_handle=row['timer_handle'],
+                    node_id=node_id,
+                    symbol=symbol,
+                    period_ns=period_ns,
+                    timer_handle=timer_handle,
                     publish_topics=None,
-                    callback_object=row['callback_object'],
-                    construction_order=row['construction_order'],
+                    callback_object=callback_object,
+                    construction_order=construction_order,
                 )
             )
 
@@ -167,11 +153,11 @@ class LttngInfo:
 
         """
         if node.node_id is None:
-            return Util.flatten([
+            return Util.flatten(
                 self._get_timer_callbacks(node)
                 for node
                 in self._get_nodes(node.node_name)
-            ])
+            )
 
         node_lttng = NodeValueLttng(node.node_name, node.node_id)
         return self._get_timer_callbacks(node_lttng)
@@ -193,9 +179,8 @@ class LttngInfo:
         added_nodes = set()
         duplicate_nodes = set()
 
-        for _, row in nodes_data.df.iterrows():
-            node_name = row['node_name']
-            node_id = row['node_id']
+        for node_name, node_id in nodes_data.df[['node_name', 'node_id']].itertuples(
+                index=False, name=None):
             if node_name in added_nodes:
                 duplicate_nodes.add(node_name)
             added_nodes.add(node_name)
@@ -223,34 +208,37 @@ class LttngInfo:
         tilde_sub = self._formatted.tilde_subscriptions.clone()
         sub.merge(tilde_sub, ['node_name', 'topic_name'], how='left')
 
-        for _, row in sub.df.iterrows():
-            node_name = row['node_name']
-            node_id = row['node_id']
-            tilde_subscription = row['tilde_subscription']
+        columns = [
+            'callback_id', 'node_name', 'node_id', 'symbol', 'topic_name',
+            'subscription_handle', 'callback_object', 'callback_object_intra',
+            'tilde_subscription', 'construction_order'
+        ]
+        for (callback_id, node_name, node_id, symbol, topic_name,
+             subscription_handle, callback_object, record_callback_object_intra,
+             tilde_subscription, construction_order) \
+                in sub.df[columns].itertuples(index=False, name=None):
             if tilde_subscription is pd.NA:
                 tilde_subscription = None
 
             # Since callback_object_intra contains nan, it is of type np.float.
-            record_callback_object_intra = row['callback_object_intra']
             if record_callback_object_intra is pd.NA:
                 callback_object_intra = None
             else:
                 callback_object_intra = int(record_callback_object_intra)
-            self._id_to_topic[row['callback_id']] = row['topic_name']
 
             sub_cbs_info[node_id].append(
                 SubscriptionCallbackValueLttng(
-                    callback_id=row['callback_id'],
+                    callback_id=callback_id,
                     node_id=node_id,
                     node_name=node_name,
-                    symbol=row['symbol'],
-                    subscribe_topic_name=row['topic_name'],
+                    symbol=symbol,
+                    subscribe_topic_name=topic_name,
                     publish_topics=None,
-                    subscription_handle=row['subscription_handle'],
-                    callback_object=row['callback_object'],
+                    subscription_handle=subscription_handle,
+                    callback_object=callback_object,
                     callback_object_intra=callback_object_intra,
                     tilde_subscription=tilde_subscription,
-                    construction_order=row['construction_order']
+                    construction_order=construction_order
                 )
             )
         return sub_cbs_info
@@ -285,11 +273,11 @@ class LttngInfo:
 
         """
         if node.node_id is None:
-            return Util.flatten([
+            return Util.flatten(
                 self._get_subscription_callback_values(node)
                 for node
                 in self._get_nodes(node.node_name)
-            ])
+            )
 
         node_lttng = NodeValueLttng(node.node_name, node.node_id)
         return self._get_subscription_callback_values(node_lttng)
@@ -311,23 +299,24 @@ class LttngInfo:
         nodes = self._formatted.nodes.clone()
         merge(srv, nodes, 'node_handle')
 
-        for _, row in srv.df.iterrows():
-            node_name = row['node_name']
-            node_id = row['node_id']
-
-            self._id_to_service[row['callback_id']] = row['service_name']
-
+        columns = [
+            'callback_id', 'node_name', 'node_id', 'symbol', 'service_name',
+            'service_handle', 'callback_object', 'construction_order'
+        ]
+        for (callback_id, node_name, node_id, symbol, service_name,
+             service_handle, callback_object, construction_order) \
+                in srv.df[columns].itertuples(index=False, name=None):
             srv_cbs_info[node_id].append(
                 ServiceCallbackValueLttng(
-                    callback_id=row['callback_id'],
+                    callback_id=callback_id,
                     node_id=node_id,
                     node_name=node_name,
-                    symbol=row['symbol'],
-                    service_name=row['service_name'],
-                    service_handle=row['service_handle'],
+                    symbol=symbol,
+                    service_name=service_name,
+                    service_handle=service_handle,
                     publish_topics=None,
-                    callback_object=row['callback_object'],
-                    construction_order=row['construction_order']
+                    callback_object=callback_object,
+                    construction_order=construction_order
                 )
             )
         return srv_cbs_info
@@ -363,11 +352,11 @@ class LttngInfo:
 
         """
         if node.node_id is None:
-            return Util.flatten([
+            return Util.flatten(
                 self._get_service_callback_values(node)
                 for node
                 in self._get_nodes(node.node_name)
-            ])
+            )
 
         node_lttng = NodeValueLttng(node.node_name, node.node_id)
         return self._get_service_callback_values(node_lttng)
@@ -392,11 +381,11 @@ class LttngInfo:
 
         """
         if node.node_id is None:
-            return Util.flatten([
+            return Util.flatten(
                 self._get_publishers(node)
                 for node
                 in self._get_nodes(node.node_name)
-            ])
+            )
 
         node_lttng = NodeValueLttng(node.node_name, node.node_id)
         return self._get_publishers(node_lttng)
@@ -419,20 +408,8 @@ class LttngInfo:
         node_id = node.node_id
         return self._get_subscriptions(node_id)
 
-    def _get_subscriptions(self, node_id: str) -> list[SubscriptionValue]:
-        """
-        Get subscriptions information.
-
-        Parameters
-        ----------
-        node_id : str
-            node ID
-
-        Returns
-        -------
-        list[SubscriptionValue]
-
-        """
+    @cached_property
+    def _subscriptions_by_node(self) -> dict[str, list[SubscriptionValue]]:
         sub = self._formatted.subscriptions.clone()
         # There is a construction_order column in both subscriptions and subscription_callbacks,
         # but they have different meanings, so rename one.
@@ -453,61 +430,63 @@ class LttngInfo:
 
         sub.merge(sub_cbs, ['subscription_handle'], how='left')
 
-        subs_info = []
-        for _, row in sub.df.iterrows():
-            if row['node_id'] != node_id:
-                continue
-            tilde_subscription = row['tilde_subscription']
-            if tilde_subscription is pd.NA:
-                tilde_subscription = None
-            callback_id = row['callback_id']
-            if callback_id is pd.NA:
+        subs_info: dict[str, list[SubscriptionValue]] = defaultdict(list)
+        columns = [
+            'node_name', 'topic_name', 'node_id', 'callback_id',
+            'subscription_construction_order'
+        ]
+        for node_name, topic_name, node_id, callback_id, construction_order \
+                in sub.df[columns].itertuples(index=False, name=None):
+            if node_id is pd.NA or callback_id is pd.NA:
                 continue
 
-            subs_info.append(
+            subs_info[node_id].append(
                 SubscriptionValue(
-                    node_name=row['node_name'],
-                    topic_name=row['topic_name'],
-                    node_id=row['node_id'],
+                    node_name=node_name,
+                    topic_name=topic_name,
+                    node_id=node_id,
                     callback_id=callback_id,
-                    construction_order=row['subscription_construction_order']
+                    construction_order=construction_order
                 )
             )
-
         return subs_info
 
-    @lru_cache
-    def get_services(self, node: NodeValueLttng) -> list[ServiceValue]:
+    def _get_subscriptions(self, node_id: str) -> list[SubscriptionValue]:
         """
-        Get services information.
+        Get subscriptions information.
 
         Parameters
         ----------
-        node: NodeValue
-            target node.
+        node_id : str
+            node ID
 
         Returns
         -------
-        list[ServiceValue]
+        list[SubscriptionValue]
 
         """
-        node_id = node.node_id
-        return self._get_services(node_id)
+        return list(self._subscriptions_by_node.get(node_id, []))
 
-    def _get_services(self, node_id: str) -> list[ServiceValue]:
+    @lru_cache
+    def get_services(self, node: NodeValueLttng) -> list[ServiceValue]:
         """
         Get services information.
 
         Parameters
         ----------
-        node_id : str
-            node ID
+        node: NodeValue
+            target node.
 
         Returns
         -------
         list[ServiceValue]
 
         """
+        node_id = node.node_id
+        return self._get_services(node_id)
+
+    @cached_property
+    def _services_by_node(self) -> dict[str, list[ServiceValue]]:
         srv = self._formatted.services.clone()
         # There is a construction_order column in both services and service_callbacks,
         # but they have different meanings, so rename one.
@@ -524,36 +503,30 @@ class LttngInfo:
 
         srv.merge(srv_cbs, ['service_handle'], how='left')
 
-        srvs_info = []
-        for _, row in srv.df.iterrows():
-            if row['node_id'] is pd.NA or row['node_id'] != node_id:
-                continue
-
-            callback_id = row['callback_id']
-            if callback_id is pd.NA:
+        srvs_info: dict[str, list[ServiceValue]] = defaultdict(list)
+        columns = [
+            'node_name', 'service_name', 'node_id', 'callback_id',
+            'service_construction_order'
+        ]
+        for node_name, service_name, node_id, callback_id, construction_order \
+                in srv.df[columns].itertuples(index=False, name=None):
+            if node_id is pd.NA or callback_id is pd.NA:
                 continue
 
-            srvs_info.append(
+            srvs_info[node_id].append(
                 ServiceValue(
-                    node_name=row['node_name'],
-                    service_name=row['service_name'],
-                    node_id=row['node_id'],
+                    node_name=node_name,
+                    service_name=service_name,
+                    node_id=node_id,
                     callback_id=callback_id,
-                    construction_order=row['service_construction_order']
+                    construction_order=construction_order
                 )
             )
-
         return srvs_info
 
-    def _get_nodes(
-        self,
-        node_name: str
-    ) -> Sequence[NodeValueLttng]:
-        return Util.filter_items(lambda x: x.node_name == node_name, self.get_nodes())
-
-    def _get_publishers_without_cb_bind(self, node_id: str) -> list[PublisherValueLttng]:
+    def _get_services(self, node_id: str) -> list[ServiceValue]:
         """
-        Get publishers information.
+        Get services information.
 
         Parameters
         ----------
@@ -562,62 +535,106 @@ class LttngInfo:
 
         Returns
         -------
-        list[PublisherInfo]
+        list[ServiceValue]
 
         """
+        return list(self._services_by_node.get(node_id, []))
+
+    @cached_property
+    def _nodes_by_name(self) -> dict[str, list[NodeValueLttng]]:
+        nodes: dict[str, list[NodeValueLttng]] = defaultdict(list)
+        for node in self.get_nodes():
+            nodes[node.node_name].append(node)
+        return nodes
+
+    def _get_nodes(
+        self,
+        node_name: str
+    ) -> Sequence[NodeValueLttng]:
+        return list(self._nodes_by_name.get(node_name, []))
+
+    @cached_property
+    def _publishers_by_node(self) -> dict[str, list[PublisherValueLttng]]:
         pub = self._formatted.publishers.clone()
         nodes = self._formatted.nodes.clone()
         merge(pub, nodes, 'node_handle')
         tilde_pub = self._formatted.tilde_publishers.clone()
 
         pub.merge(tilde_pub, ['node_name', 'topic_name'], how='left')
-        # pub = pub.astype({'tilde_publisher': 'Int64'})
-        pubs_info = []
-        for _, row in pub.df.iterrows():
-            if row['node_id'] != node_id:
-                continue
-            tilde_publisher = row['tilde_publisher']
+
+        pubs_info: dict[str, list[PublisherValueLttng]] = defaultdict(list)
+        columns = [
+            'node_name', 'topic_name', 'node_id', 'publisher_handle',
+            'tilde_publisher', 'construction_order'
+        ]
+        for (node_name, topic_name, node_id, publisher_handle,
+             tilde_publisher, construction_order) \
+                in pub.df[columns].itertuples(index=False, name=None):
             if tilde_publisher is pd.NA:
                 tilde_publisher = None
 
-            pubs_info.append(
+            pubs_info[node_id].append(
                 PublisherValueLttng(
-                    node_name=row['node_name'],
-                    topic_name=row['topic_name'],
-                    node_id=row['node_id'],
+                    node_name=node_name,
+                    topic_name=topic_name,
+                    node_id=node_id,
                     callback_ids=None,
-                    publisher_handle=row['publisher_handle'],
+                    publisher_handle=publisher_handle,
                     tilde_publisher=tilde_publisher,
-                    construction_order=row['construction_order']
+                    construction_order=construction_order
                 )
             )
 
         return pubs_info
 
+    def _get_publishers_without_cb_bind(self, node_id: str) -> list[PublisherValueLttng]:
+        """
+        Get publishers information.
+
+        Parameters
+        ----------
+        node_id : str
+            node ID
+
+        Returns
+        -------
+        list[PublisherInfo]
+
+        """
+        return list(self._publishers_by_node.get(node_id, []))
+
+    @cached_property
+    def _id_to_topic(self) -> dict[str, str]:
+        sub = self._formatted.subscription_callbacks.df
+        return dict(zip(sub['callback_id'].to_numpy(), sub['topic_name'].to_numpy()))
+
+    @cached_property
+    def _id_to_service(self) -> dict[str, str]:
+        srv = self._formatted.service_callbacks.df
+        return dict(zip(srv['callback_id'].to_numpy(), srv['service_name'].to_numpy()))
+
     def _is_user_made_callback(
         self,
         callback_id: str
     ) -> bool:
-        is_subscription = callback_id in self._id_to_topic.keys()
+        is_subscription = callback_id in self._id_to_topic
         if not is_subscription:
             return True
-        is_service = callback_id in self._id_to_service.keys()
+        is_service = callback_id in self._id_to_service
         if not is_service:
             return True
         topic_name = self._id_to_topic[callback_id]
 
         return topic_name not in ['/clock', '/parameter_events']
 
-    @lru_cache
-    def _get_callback_groups(
-        self,
-        node_id: str
-    ) -> list[CallbackGroupValueLttng]:
+    @cached_property
+    def _callback_groups_by_node(self) -> dict[str, list[CallbackGroupValueLttng]]:
         concat_target_dfs = []
         concat_target_dfs.append(self._formatted.timer_callbacks.clone())
         concat_target_dfs.append(self._formatted.subscription_callbacks.clone())
         concat_target_dfs.append(self._formatted.service_callbacks.clone())
 
+        callback_groups_values: dict[str, list[CallbackGroupValueLttng]] = defaultdict(list)
         try:
             column_names = [
                 'callback_group_addr', 'callback_id', 'node_handle'
@@ -629,48 +646,56 @@ class LttngInfo:
             merge(concat, nodes, 'node_handle')
             merge(concat, callback_groups, 'callback_group_addr', how='left')
 
-            callback_groups_values: list[CallbackGroupValueLttng] = []
-            for _, group_df in concat.df.groupby('callback_group_addr'):
-                row = group_df.iloc[0, :]
-                node_id_ = row['node_id']
-                if node_id != node_id_:
-                    continue
-
-                callback_ids = tuple(group_df['callback_id'].values)
-                callback_ids = tuple(Util.filter_items(self._is_user_made_callback, callback_ids))
-
-                # For the case where the callback_group is not linked to the executor
-                if row['executor_addr'] is not pd.NA:
-                    executor_addr = row['executor_addr']
-                else:
-                    executor_addr = 0
-                if row['callback_group_id'] is not pd.NA:
-                    callback_group_id = row['callback_group_id']
-                else:
-                    callback_group_addr = row['callback_group_addr']
-                    # There is no corresponding row in callback_groups.df.
-                    # Generate callback_group_id there.
-                    callback_group_id = CallbackGroupAddr(callback_group_addr).group_id
-                if row['group_type_name'] is not pd.NA:
-                    group_type_name = row['group_type_name']
-                else:
-                    group_type_name = 'UNDEFINED'
-
-                callback_groups_values.append(
-                    CallbackGroupValueLttng(
-                        callback_group_type_name=group_type_name,
-                        node_name=row['node_name'],
-                        node_id=node_id,
-                        callback_ids=callback_ids,
-                        callback_group_id=callback_group_id,
-                        callback_group_addr=row['callback_group_addr'],
-                        executor_addr=executor_addr,
-                    )
+            df = concat.df
+            callback_ids_by_group = \
+                df.groupby('callback_group_addr', sort=False)['callback_id'].agg(tuple).to_dict()
+            # The first row of each group holds the group-level columns.
+            first_rows = df.drop_duplicates('callback_group_addr') \
+                .sort_values('callback_group_addr')
+            columns = [
+                'callback_group_addr', 'node_id', 'node_name',
+                'executor_addr', 'callback_group_id', 'group_type_name'
+            ]
+        except KeyError:
+            return callback_groups_values
+
+        for (callback_group_addr, node_id, node_name,
+             executor_addr, callback_group_id, group_type_name) \
+                in first_rows[columns].itertuples(index=False, name=None):
+            if callback_group_addr not in callback_ids_by_group:
+                continue
+            callback_ids = tuple(Util.filter_items(
+                self._is_user_made_callback, callback_ids_by_group[callback_group_addr]))
+
+            # For the case where the callback_group is not linked to the executor
+            if executor_addr is pd.NA:
+                executor_addr = 0
+            if callback_group_id is pd.NA:
+                # There is no corresponding row in callback_groups.df.
+                # Generate callback_group_id there.
+                callback_group_id = CallbackGroupAddr(callback_group_addr).group_id
+            if group_type_name is pd.NA:
+                group_type_name = 'UNDEFINED'
+
+            callback_groups_values[node_id].append(
+                CallbackGroupValueLttng(
+                    callback_group_type_name=group_type_name,
+                    node_name=node_name,
+                    node_id=node_id,
+                    callback_ids=callback_ids,
+                    callback_group_id=callback_group_id,
+                    callback_group_addr=callback_group_addr,
+                    executor_addr=executor_addr,
                 )
+            )
 
-            return callback_groups_values
-        except KeyError:
-            return []
+        return callback_groups_values
+
+    def _get_callback_groups(
+        self,
+        node_id: str
+    ) -> list[CallbackGroupValueLttng]:
+        return list(self._callback_groups_by_node.get(node_id, []))
 
     def get_callback_groups(
         self,
@@ -685,11 +710,11 @@ class LttngInfo:
 
         """
         if node.node_id is None:
-            return Util.flatten([
+            return Util.flatten(
                 self._get_callback_groups(node.node_id)
                 for node
                 in self._get_nodes(node.node_name)
-            ])
+            )
 
         node_lttng = NodeValueLttng(node.node_name, node.node_id)
         return self._get_callback_groups(node_lttng.node_id)
@@ -703,51 +728,72 @@ class LttngInfo:
         list[ExecutorInfo]
 
         """
+        return list(self._executors)
+
+    @cached_property
+    def _executors(self) -> list[ExecutorValue]:
         executor = self._formatted.executor.clone()
         callback_groups = self._formatted.callback_groups.clone()
         merge(executor, callback_groups, 'executor_addr')
-        execs = []
 
-        for _, group in executor.df.groupby('executor_addr'):
-            row = group.iloc[0, :]
-            executor_type_name = row['executor_type_name']
+        df = executor.df
+        cbg_ids_by_executor = \
+            df.groupby('executor_addr', sort=False)['callback_group_id'].agg(tuple).to_dict()
+        # The first row of each group holds the executor-level columns.
+        first_rows = df.drop_duplicates('executor_addr').sort_values('executor_addr')
 
-            cbg_ids = group['callback_group_id'].values
+        execs = []
+        for executor_addr, executor_type_name \
+                in first_rows[['executor_addr', 'executor_type_name']].itertuples(
+                    index=False, name=None):
+            if executor_addr not in cbg_ids_by_executor:
+                continue
             execs.append(
                 ExecutorValue(
                     executor_type_name,
-                    tuple(cbg_ids))
+                    cbg_ids_by_executor[executor_addr])
             )
 
         return execs
 
+    @staticmethod
+    def _group_depths(data: TracePointData, key_column: str) -> dict[int, list[int]]:
+        depths: dict[int, list[int]] = defaultdict(list)
+        for key, depth in data.df[[key_column, 'depth']].itertuples(index=False, name=None):
+            depths[key].append(depth)
+        return depths
+
+    @cached_property
+    def _publisher_depths(self) -> dict[int, list[int]]:
+        return self._group_depths(self._formatted.publishers, 'publisher_handle')
+
+    @cached_property
+    def _subscription_depths(self) -> dict[int, list[int]]:
+        return self._group_depths(self._formatted.subscription_callbacks, 'callback_object')
+
     def get_publisher_qos(self, publisher: PublisherValueLttng) -> Qos:
-        publishers = self._formatted.publishers.clone()
-        publishers.filter_rows('publisher_handle', publisher.publisher_handle)
+        depths = self._publisher_depths.get(publisher.publisher_handle, [])
 
-        if len(publishers) == 0:
+        if len(depths) == 0:
             raise InvalidArgumentError('No publisher matching the criteria was found.')
-        if len(publishers) > 1:
+        if len(depths) > 1:
             logger.warning(
                 'Multiple publishers matching your criteria were found.'
                 'The value of the first publisher qos will be returned.')
 
-        depth = int(publishers.at('depth', 0))
-        return Qos(depth)
+        return Qos(int(depths[0]))
 
     def get_subscription_qos(self, callback: SubscriptionCallbackValueLttng) -> Qos:
-        subscription = self._formatted.subscription_callbacks.clone()
-        subscription.filter_rows('callback_object', callback.callback_object)
+        depths = self._subscription_depths.get(callback.callback_object, [])
 
-        if len(subscription) == 0:
+        if len(depths) == 0:
             raise InvalidArgumentError('No subscription matching the criteria was found.')
-        if len(subscription) > 1:
+        if len(depths) > 1:
             logger.warning(
                 'Multiple publishers matching your criteria were found.'
                 'The value of the first publisher qos will be returned.')
 
-        depth = int(subscription.at('depth', 0))
-        return Qos(depth)
+        return Qos(int(depths[0]))
 
     @lru_cache
     def get_timers(self, node: NodeValueLttng) -> list[TimerValue]:
@@ -767,20 +813,8 @@ class LttngInfo:
         node_id = node.node_id
         return self._get_timers(node_id)
 
-    def _get_timers(self, node_id: str) -> list[TimerValue]:
-        """
-        Get timers information.
-
-        Parameters
-        ----------
-        node_id : str
-            node ID
-
-        Returns
-        -------
-        list[TimerValue]
-
-        """
+    @cached_property
+    def _timers_by_node(self) -> dict[str, list[TimerValue]]:
         tim = self._formatted.timers.clone()
         # There is a construction_order column in both timer and timer_callbacks,
         # but they have different meanings, so rename one.
@@ -797,32 +831,53 @@ class LttngInfo:
 
         tim.merge(time_cbs, ['timer_handle'], how='left')
 
-        times_info = []
-        for _, row in tim.df.iterrows():
-            if row['node_id'] != node_id:
+        times_info: dict[str, list[TimerValue]] = defaultdict(list)
+        columns = [
+            'node_name', 'period', 'node_id', 'callback_id', 'timer_construction_order'
+        ]
+        for node_name, period, node_id, callback_id, construction_order \
+                in tim.df[columns].itertuples(index=False, name=None):
+            if node_id is pd.NA:
                 continue
 
-            times_info.append(
+            times_info[node_id].append(
                 TimerValue(
-                    node_name=row['node_name'],
-                    period=row['period'],
-                    node_id=row['node_id'],
-                    callback_id=row['callback_id'],
-                    construction_order=row['timer_construction_order']
+                    node_name=node_name,
+                    period=period,
+                    node_id=node_id,
+                    callback_id=callback_id,
+                    construction_order=construction_order
                 )
             )
-
         return times_info
 
-    def get_timer_controls(self) -> Sequence[TimerControl]:
+    def _get_timers(self, node_id: str) -> list[TimerValue]:
+        """
+        Get timers information.
+
+        Parameters
+        ----------
+        node_id : str
+            node ID
+
+        Returns
+        -------
+        list[TimerValue]
+
+        """
+        return list(self._timers_by_node.get(node_id, []))
+
+    @cached_property
+    def _timer_controls(self) -> list[TimerControl]:
         timer_controls = self._formatted.timer_controls.clone()
         controls: list[TimerControl] = []
-        for _, row in timer_controls.df.iterrows():
-            if row['type'] == 'init':
-                params = row['params']
+        columns = ['type', 'timer_handle', 'timestamp', 'params']
+        for control_type, timer_handle, timestamp, params \
+                in timer_controls.df[columns].itertuples(index=False, name=None):
+            if control_type == 'init':
                 control = TimerInit(
-                    int(row['timer_handle']),
-                    int(row['timestamp']),
+                    int(timer_handle),
+                    int(timestamp),
                     int(params['period']))
                 controls.append(control)
             else:
@@ -830,33 +885,48 @@ class LttngInfo:
 
         return controls
 
+    @cached_property
+    def _timer_controls_by_handle(self) -> dict[int, list[TimerControl]]:
+        controls: dict[int, list[TimerControl]] = defaultdict(list)
+        for control in self._timer_controls:
+            controls[control.timer_handle].append(control)
+        return controls
+
+    def get_timer_controls(self, timer_handle: int | None = None) -> Sequence[TimerControl]:
+        """
+        Get timer controls.
+
+        Parameters
+        ----------
+        timer_handle : int | None, optional
+            If given, only the controls of the timer are returned, by default None.
+
+        Returns
+        -------
+        Sequence[TimerControl]
+
+        """
+        if timer_handle is None:
+            return list(self._timer_controls)
+        return list(self._timer_controls_by_handle.get(timer_handle, []))
+
 
 class DataFrameFormatted:
 
     def __init__(self, data: Ros2DataModel):
-        self._executor_df = self._build_executor(data)
-        self._nodes = self._build_nodes(data)
-        self._timer_callbacks = self._build_timer_callbacks(data)
-        self._sub_callbacks = self._build_sub_callbacks(data)
-        self._srv_callbacks = self._build_srv_callbacks(data)
-        self._cbg = self._build_cbg(data)
-        self._pub = self._build_publisher(data)
-        self._sub = self._build_subscription(data)
-        self._srv = self._build_service(data)
-        self._tim = self._build_timer(data)
-        self._tilde_sub = self._build_tilde_subscription(data)
-        self._tilde = self._build_tilde_publisher(data)
-        self._tilde_sub_id_to_sub = self._build_tilde_sub_id(data, self._tilde_sub)
-        self._timer_control = self._build_timer_control(data)
+        # Tables are built on first access, so only the ones that are used get built.
+        self._data = data
+
+    @cached_property
+    def _tilde_sub_id_to_sub(self) -> TracePointData:
+        return self._build_tilde_sub_id(self._data, self.tilde_subscriptions)
 
     @cached_property
     def tilde_sub_id_map(self) -> dict[int, int]:
-        d: dict[int, int] = {}
-        for _, row in self._tilde_sub_id_to_sub.df.iterrows():
-            d[row['subscription_id']] = row['tilde_subscription']
-        return d
+        df = self._tilde_sub_id_to_sub.df
+        return dict(zip(df['subscription_id'], df['tilde_subscription']))
 
-    @property
+    @cached_property
     def timer_callbacks(self) -> TracePointData:
         """
         Build timer callbacks table.
@@ -880,9 +950,9 @@ class DataFrameFormatted:
             - construction_order
 
         """
-        return self._timer_callbacks
+        return self._build_timer_callbacks(self._data)
 
-    @property
+    @cached_property
     def subscription_callbacks(self) -> TracePointData:
         """
         Build subscription callback table.
@@ -908,9 +978,9 @@ class DataFrameFormatted:
             - construction_order
 
         """
-        return self._sub_callbacks
+        return self._build_sub_callbacks(self._data)
 
-    @property
+    @cached_property
     def service_callbacks(self) -> TracePointData:
         """
         Build service callback table.
@@ -934,9 +1004,9 @@ class DataFrameFormatted:
             - construction_order
 
         """
-        return self._srv_callbacks
+        return self._build_srv_callbacks(self._data)
 
-    @property
+    @cached_property
     def nodes(self) -> TracePointData:
         """
         Build node table.
@@ -955,9 +1025,9 @@ class DataFrameFormatted:
             - node_name
 
         """
-        return self._nodes
+        return self._build_nodes(self._data)
 
-    @property
+    @cached_property
     def publishers(self) -> TracePointData:
         """
         Get publisher info table.
@@ -975,9 +1045,9 @@ class DataFrameFormatted:
             - construction_order
 
         """
-        return self._pub
+        return self._build_publisher(self._data)
 
-    @property
+    @cached_property
     def subscriptions(self) -> TracePointData:
         """
         Get subscription info table.
@@ -995,9 +1065,9 @@ class DataFrameFormatted:
             - construction_order
 
         """
-        return self._sub
+        return self._build_subscription(self._data)
 
-    @property
+    @cached_property
     def services(self) -> TracePointData:
         """
         Get service info table.
@@ -1014,9 +1084,9 @@ class DataFrameFormatted:
             - construction_order
 
         """
-        return self._srv
+        return self._build_service(self._data)
 
-    @property
+    @cached_property
     def timers(self) -> TracePointData:
         """
         Get timer info table.
@@ -1033,9 +1103,9 @@ class DataFrameFormatted:
             - construction_order
 
         """
-        return self._tim
+        return self._build_timer(self._data)
 
-    @property
+    @cached_property
     def executor(self) -> TracePointData:
         """
         Get executor info table.
@@ -1050,9 +1120,9 @@ class DataFrameFormatted:
             - executor_type_name
 
         """
-        return self._executor_df
+        return self._build_executor(self._data)
 
-    @property
+    @cached_property
     def callback_groups(self) -> TracePointData:
         """
         Get callback group info table.
@@ -1068,9 +1138,9 @@ class DataFrameFormatted:
             - group_type_name
 
         """
-        return self._cbg
+        return self._build_cbg(self._data)
 
-    @property
+    @cached_property
     def tilde_publishers(self) -> TracePointData:
         """
         Get tilde wrapped publisher.
@@ -1086,9 +1156,9 @@ class DataFrameFormatted:
             - topic_name
 
         """
-        return self._tilde
+        return self._build_tilde_publisher(self._data)
 
-    @property
+    @cached_property
     def tilde_subscriptions(self) -> TracePointData:
         """
         Get tilde wrapped subscription.
@@ -1102,11 +1172,11 @@ class DataFrameFormatted:
             - topic_name
 
         """
-        return self._tilde_sub
+        return self._build_tilde_subscription(self._data)
 
-    @property
+    @cached_property
     def timer_controls(self) -> TracePointData:
-        return self._timer_control
+        return self._build_timer_control(self._data)
 
     @staticmethod
     @lru_cache
@@ -1135,11 +1205,10 @@ class DataFrameFormatted:
         DataFrameFormatted._add_construction_order_publisher_or_subscription(
             publishers, 'construction_order', 'timestamp', 'node_handle', 'topic_name')
 
-        def to_publisher_id(row: pd.Series):
-            publisher_handle = row['publisher_handle']
-            return f'publisher_{publisher_handle}'
+        def to_publisher_id(df: pd.DataFrame) -> pd.Series:
+            return 'publisher_' + df['publisher_handle'].astype(str)
 
-        publishers.add_column('publisher_id', to_publisher_id)
+        publishers.add_vectorized_column('publisher_id', to_publisher_id)
         publishers.set_columns(columns)
         publishers.drop_duplicate()
 
@@ -1159,11 +1228,10 @@ class DataFrameFormatted:
         DataFrameFormatted._add_construction_order_publisher_or_subscription(
             subscriptions, 'construction_order', 'timestamp', 'node_handle', 'topic_name')
 
-        def to_subscription_id(row: pd.Series):
-            subscription_handle = row['subscription_handle']
-            return f'subscription_{subscription_handle}'
+        def to_subscription_id(df: pd.DataFrame) -> pd.Series:
+            return 'subscription_' + df['subscription_handle'].astype(str)
 
-        subscriptions.add_column('subscription_id', to_subscription_id)
+        subscriptions.add_vectorized_column('subscription_id', to_subscription_id)
         subscriptions.set_columns(columns)
         subscriptions.drop_duplicate()
 
@@ -1184,11 +1252,10 @@ class DataFrameFormatted:
         DataFrameFormatted._add_construction_order_service(
             services, 'construction_order', 'timestamp', 'node_handle', 'service_name')
 
-        def to_service_id(row: pd.Series):
-            service_handle = row['service_handle']
-            return f'service_{service_handle}'
+        def to_service_id(df: pd.DataFrame) -> pd.Series:
+            return 'service_' + df['service_handle'].astype(str)
 
-        services.add_column('service_id', to_service_id)
+        services.add_vectorized_column('service_id', to_service_id)
         services.set_columns(columns)
         services.drop_duplicate()
 
@@ -1214,11 +1281,10 @@ class DataFrameFormatted:
         DataFrameFormatted._add_construction_order_timer(
             timers, 'construction_order', 'timestamp', 'node_handle', 'period')
 
-        def to_timer_id(row: pd.Series):
-            timer_handle = row['timer_handle']
-            return f'timer_{timer_handle}'
+        def to_timer_id(df: pd.DataFrame) -> pd.Series:
+            return 'timer_' + df['timer_handle'].astype(str)
 
-        timers.add_column('timer_id', to_timer_id)
+        timers.add_vectorized_column('timer_id', to_timer_id)
         timers.drop_duplicate()
 
         timers.set_columns(columns)
@@ -1232,7 +1298,7 @@ class DataFrameFormatted:
         columns = ['timestamp', 'timer_handle', 'type', 'params']
         timers = data.timers.clone()
         timers.reset_index()
-        timers.add_column('type', lambda _: 'init')
+        timers.add_vectorized_column('type', lambda _: 'init')
 
         def to_params(row: pd.Series):
             return {'period': row['period']}
@@ -1257,11 +1323,10 @@ class DataFrameFormatted:
             executors = TracePointData.concat(
                 [executors, executors_static], columns_)
 
-        def to_executor_id(row: pd.Series) -> str:
-            addr = row['executor_addr']
-            return f'executor_{addr}'
+        def to_executor_id(df: pd.DataFrame) -> pd.Series:
+            return 'executor_' + df['executor_addr'].astype(str)
 
-        executors.add_column('executor_id', to_executor_id)
+        executors.add_vectorized_column('executor_id', to_executor_id)
         executors.set_columns(columns)
 
         # data.callback_groups returns duplicate results that differ only in timestamp.
@@ -1301,42 +1366,39 @@ class DataFrameFormatted:
                 callback_groups = TracePointData.concat(
                     [callback_groups, callback_groups_static], columns_)
 
-        def to_callback_group_id(row: pd.Series) -> str:
-            addr = row['callback_group_addr']
-            return CallbackGroupAddr(addr).group_id
+        def to_callback_group_id(df: pd.DataFrame) -> pd.Series:
+            return df['callback_group_addr'].map(CallbackGroupAddr.to_id)
 
-        callback_groups.add_column('callback_group_id', to_callback_group_id)
+        callback_groups.add_vectorized_column('callback_group_id', to_callback_group_id)
         callback_groups.set_columns(columns)
 
         # data.callback_groups returns duplicate results that differ only in timestamp.
         # Remove duplicates to make it unique.
         callback_groups.drop_duplicate()
 
-        executor_duplicated_indexes = []
-        for _, group in callback_groups.df.groupby('callback_group_addr'):
-            if len(group) >= 2:
+        df = callback_groups.df
+        addrs = df['callback_group_addr']
+        # All but the last row of each callback group using multiple executors.
+        executor_duplicated = addrs.duplicated(keep='last') & addrs.notna()
+        if executor_duplicated.any():
+            data_model_srv = DataModelService(data)
+            for addr in sorted(addrs[executor_duplicated].unique()):
                 msg = ('Multiple executors using the same callback group were detected. '
                        'The last executor will be used. ')
-                exec_addr = list(group['executor_addr'].values)
+                exec_addr = list(df.loc[addrs == addr, 'executor_addr'].values)
                 msg += f'executor address: {exec_addr}. '
-                data_model_srv = DataModelService(data)
-                cbg_addr = set(group['callback_group_addr'].values)
-                for addr in cbg_addr:
-                    node_names_and_cb_symbols = data_model_srv.get_node_names_and_cb_symbols(addr)
-                    msg += f'callback_group_addr: {addr}.\n'
-                    for i, node_name_and_cb_symbol in enumerate(node_names_and_cb_symbols):
-                        msg += f'\t|node name {i}| {node_name_and_cb_symbol[0]}.\n'
-                        msg += f'\t|callback symbol {i}| {node_name_and_cb_symbol[1]}.\n'
+                node_names_and_cb_symbols = data_model_srv.get_node_names_and_cb_symbols(addr)
+                msg += f'callback_group_addr: {addr}.\n'
+                for i, node_name_and_cb_symbol in enumerate(node_names_and_cb_symbols):
+                    msg += f'\t|node name {i}| {node_name_and_cb_symbol[0]}.\n'
+                    msg += f'\t|callback symbol {i}| {node_name_and_cb_symbol[1]}.\n'
                 # This warning occurs frequently,
                 # but currently does not significantly affect behavior.
                 # Therefore, the log level is temporarily lowered.
                 logger.log(WARN-1, msg)
-                executor_duplicated_indexes += list(group.index)[:-1]
 
-        if len(executor_duplicated_indexes) >= 1:
-            callback_groups.drop_row(executor_duplicated_indexes)
+            callback_groups.drop_row(list(df.index[executor_duplicated]))
 
-        callback_groups.drop_duplicate()
         return callback_groups
 
     @staticmethod
@@ -1348,9 +1410,8 @@ class DataFrameFormatted:
             'period_ns', 'symbol', 'construction_order'
         ]
 
-        def callback_id(row: pd.Series) -> str:
-            cb_object = row['callback_object']
-            return f'timer_callback_{cb_object}'
+        def callback_id(df: pd.DataFrame) -> pd.Series:
+            return 'timer_callback_' + df['callback_object'].astype(str)
         timers = data.timers.clone()
         timers.reset_index()
         timers.rename_column('period', 'period_ns')
@@ -1379,7 +1440,7 @@ class DataFrameFormatted:
         callback_group_timer.reset_index()
         merge(timers, callback_group_timer, 'timer_handle')
 
-        timers.add_column('callback_id', callback_id)
+        timers.add_vectorized_column('callback_id', callback_id)
 
         timers.set_columns(columns)
 
@@ -1400,9 +1461,8 @@ class DataFrameFormatted:
             'construction_order'
         ]
 
-        def callback_id(row: pd.Series) -> str:
-            cb_object = row['callback_object']
-            return f'subscription_callback_{cb_object}'
+        def callback_id(df: pd.DataFrame) -> pd.Series:
+            return 'subscription_callback_' + df['callback_object'].astype(str)
 
         merge_drop_columns = ['tid', 'rmw_handle']
 
@@ -1428,15 +1488,13 @@ class DataFrameFormatted:
         callback_group_subscription.reset_index()
         merge(subscriptions, callback_group_subscription, 'subscription_handle')
 
-        subscriptions.add_column('callback_id', callback_id)
+        subscriptions.add_vectorized_column('callback_id', callback_id)
 
         subscriptions.set_columns(columns)
         subscriptions.drop_duplicate()
 
         return subscriptions
 
-    KeyType = tuple[int | str, int | str, str | int]
-
     @staticmethod
     def _add_construction_order(
         data: TracePointData,
@@ -1448,22 +1506,8 @@ class DataFrameFormatted:
     ) -> None:
 
         data.sort(timestamp_column)
-        order: dict[DataFrameFormatted.KeyType, int] = defaultdict(int)
-
-        def construct_order(row: pd.Series) -> int:
-            node = row[node_handle_column]
-            callback_param = row[callback_parameter_column]
-            symbol = row[symbol_column]
-            key: DataFrameFormatted.KeyType = node, callback_param, symbol
-            order_ = int(order[key])
-            order[key] += 1
-            return order_
-
-        data.add_column(column_name, construct_order)
-
-    KeyTypePubSub = tuple[int | str, str | int]
-    KeyTypeTopic = tuple[int | str, str | int]
-    KeyTypePeriod = tuple[int | str, int | str]
+        data.add_group_order_column(
+            column_name, [node_handle_column, callback_parameter_column, symbol_column])
 
     @staticmethod
     def _add_construction_order_publisher_or_subscription(
@@ -1475,16 +1519,7 @@ class DataFrameFormatted:
     ) -> None:
 
         data.sort(timestamp_column)
-        order: dict[DataFrameFormatted.KeyTypePubSub, int] = defaultdict(int)
-
-        def construct_order(row: pd.Series) -> int:
-            node = row[node_handle_column]
-            key: DataFrameFormatted.KeyTypePubSub = node, row[topic_name]
-            order_ = int(order[key])
-            order[key] += 1
-            return order_
-
-        data.add_column(column_name, construct_order)
+        data.add_group_order_column(column_name, [node_handle_column, topic_name])
 
     @staticmethod
     def _add_construction_order_service(
@@ -1496,16 +1531,7 @@ class DataFrameFormatted:
     ) -> None:
 
         data.sort(timestamp_column)
-        order: dict[DataFrameFormatted.KeyTypePubSub, int] = defaultdict(int)
-
-        def construct_order(row: pd.Series) -> int:
-            node = row[node_handle_column]
-            key: DataFrameFormatted.KeyTypePubSub = node, row[service_name_column]
-            order_ = int(order[key])
-            order[key] += 1
-            return order_
-
-        data.add_column(column_name, construct_order)
+        data.add_group_order_column(column_name, [node_handle_column, service_name_column])
 
     @staticmethod
     def _add_construction_order_timer(
@@ -1517,17 +1543,7 @@ class DataFrameFormatted:
     ) -> None:
 
         data.sort(timestamp_column)
-        order: dict[DataFrameFormatted.KeyTypePeriod, int] = defaultdict(int)
-
-        def construct_order(row: pd.Series) -> int:
-            node = row[node_handle_column]
-            timer_param = row[period_ns_column]
-            key: DataFrameFormatted.KeyTypePeriod = node, timer_param
-            order_ = int(order[key])
-            order[key] += 1
-            return order_
-
-        data.add_column(column_name, construct_order)
+        data.add_group_order_column(column_name, [node_handle_column, period_ns_column])
 
     @staticmethod
     def _build_srv_callbacks(
@@ -1538,9 +1554,8 @@ class DataFrameFormatted:
             'service_handle', 'callback_group_addr', 'service_name', 'symbol', 'construction_order'
         ]
 
-        def callback_id(row: pd.Series) -> str:
-            cb_object = row['callback_object']
-            return f'service_callback_{cb_object}'
+        def callback_id(df: pd.DataFrame) -> pd.Series:
+            return 'service_callback_' + df['callback_object'].astype(str)
 
         merge_drop_columns = ['tid', 'rmw_handle']
 
@@ -1566,7 +1581,7 @@ class DataFrameFormatted:
         callback_group_service.reset_index()
         merge(services, callback_group_service, 'service_handle')
 
-        services.add_column('callback_id', callback_id)
+        services.add_vectorized_column('callback_id', callback_id)
 
         services.set_columns(columns)
         services.drop_duplicate()
@@ -1623,9 +1638,8 @@ class DataFrameFormatted:
             'subscription_handle', 'callback_group_addr', 'topic_name', 'symbol', 'depth'
         ]
 
-        def callback_id(row: pd.Series) -> str:
-            cb_object = row['callback_object']
-            return f'subscription_callback_{cb_object}'
+        def callback_id(df: pd.DataFrame) -> pd.Series:
+            return 'subscription_callback_' + df['callback_object'].astype(str)
 
         subscriptions = data.subscriptions.clone()
         subscriptions.reset_index()
@@ -1641,7 +1655,7 @@ class DataFrameFormatted:
         cbg.reset_index()
         merge(subscriptions, cbg, 'subscription_handle')
 
-        subscriptions.add_column('callback_id', callback_id)
+        subscriptions.add_vectorized_column('callback_id', callback_id)
 
         subscriptions.set_columns(columns)
         subscriptions.drop_duplicate()
@@ -1649,29 +1663,23 @@ class DataFrameFormatted:
         return subscriptions
 
     @staticmethod
-    def _is_ignored_subscription(
-        data: Ros2DataModel,
-        subscription_handle: int
-    ) -> bool:
+    def _get_ignored_subscription_handles(
+        data: Ros2DataModel
+    ) -> set[int]:
         sub_df = data.subscriptions.clone()
-        sub_df.filter_rows('index', subscription_handle)
+        sub_df.reset_index()
         nodes = data.nodes.clone()
         nodes.reset_index()
         merge(sub_df, nodes, 'node_handle')
 
+        df = sub_df.df
         try:
-            ns = sub_df.at(0, 'namespace')
-            name = sub_df.at(0, 'name')
-            topic_name = sub_df.at(0, 'topic_name')
-
-            if ns == '/' and name == 'rviz2':
-                return True
-
-            if topic_name == '/parameter_events':
-                return True
+            is_rviz2 = (df['namespace'] == '/') & (df['name'] == 'rviz2')
+            is_parameter_events = df['topic_name'] == '/parameter_events'
         except KeyError:
-            pass
-        return False
+            return set()
+        ignored = df.loc[(is_rviz2 | is_parameter_events).fillna(False), 'subscription_handle']
+        return set(ignored)
 
     @staticmethod
     def _format_subscription_callback_object(
@@ -1715,28 +1723,32 @@ class DataFrameFormatted:
             ['subscription_handle', 'callback_object', 'callback_object_intra'],
             {'callback_object_intra': 'Int64'}
         )
-        for key, group in subscription_objects.df.groupby('subscription_handle'):
-            group.reset_index(drop=True, inplace=True)
-
-            subscription_handle = int(key)  # type: ignore
-            if DataFrameFormatted._is_ignored_subscription(data, subscription_handle):
+        ignored_handles = DataFrameFormatted._get_ignored_subscription_handles(data)
+
+        # NOTE:
+        # The smaller timestamp is the callback_object of the in-process communication.
+        # The larger timestamp is callback_object for inter-process communication.
+        df = subscription_objects.df.sort_values('timestamp', kind='stable')
+        group_sizes = df.groupby('subscription_handle').size()
+        first_cb_objs = df.drop_duplicates('subscription_handle', keep='first') \
+            .set_index('subscription_handle')['callback_object']
+        last_cb_objs = df.drop_duplicates('subscription_handle', keep='last') \
+            .set_index('subscription_handle')['callback_object']
+
+        for key, size in group_sizes.items():
+            if int(key) in ignored_handles:  # type: ignore
                 continue
 
             record = {
                 'subscription_handle': key,
             }
-            if len(group) == 1:
-                record['callback_object'] = group.at[0, 'callback_object']
-            elif len(group) == 2:
-                # NOTE:
-                # The smaller timestamp is the callback_object of the in-process communication.
-                # The larger timestamp is callback_object for inter-process communication.
-                group.sort_values('timestamp', inplace=True)
-                group.reset_index(drop=True, inplace=True)
-                record['callback_object'] = group.at[1, 'callback_object']
-                record['callback_object_intra'] = group.at[0, 'callback_object']
+            if size == 1:
+                record['callback_object'] = last_cb_objs[key]
+            elif size == 2:
+                record['callback_object'] = last_cb_objs[key]
+                record['callback_object_intra'] = first_cb_objs[key]
             else:
-                cb_objs = group['callback_object'].values
+                cb_objs = df.loc[df['subscription_handle'] == key, 'callback_object'].values
                 logger.warning(
                     'More than three callbacks are registered in one subscription_handle. '
                     'Skip loading callback info. The following callbacks cannot be measured.'
@@ -1757,23 +1769,16 @@ class DataFrameFormatted:
         node = data.nodes.clone()
         node.reset_index()
 
-        def ns_and_node_name(row: pd.Series) -> str:
-            ns: str = row['namespace']
-            name: str = row['name']
-
-            if ns[-1] == '/':
-                return ns + name
-            else:
-                return ns + '/' + name
+        def ns_and_node_name(df: pd.DataFrame) -> pd.Series:
+            ns = df['namespace'].astype(str)
+            return ns.where(ns.str.endswith('/'), ns + '/') + df['name'].astype(str)
 
-        node.add_column('node_name', ns_and_node_name)
+        node.add_vectorized_column('node_name', ns_and_node_name)
 
-        def to_node_id(row: pd.Series) -> str:
-            node_name = row['node_name']
-            node_handle = row['node_handle']
-            return f'{node_name}_{node_handle}'
+        def to_node_id(df: pd.DataFrame) -> pd.Series:
+            return df['node_name'] + '_' + df['node_handle'].astype(str)
 
-        node.add_column('node_id', to_node_id)
+        node.add_vectorized_column('node_id', to_node_id)
         node.set_columns(columns)
         node.drop_duplicate()
 
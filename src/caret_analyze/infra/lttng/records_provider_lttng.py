@@ -103,8 +103,9 @@ class RecordsProviderLttng(RuntimeDataProvider):
         """
         assert comm_val.subscribe_callback_name is not None
 
-        if self.is_intra_process_communication(comm_val):
-            return self._compose_intra_proc_comm_records(comm_val)
+        intra_records = self._compose_intra_proc_comm_records(comm_val)
+        if len(intra_records) > 0:
+            return intra_records
 
         return self._compose_inter_proc_comm_records(comm_val)
 
@@ -1559,8 +1560,7 @@ class FilteredRecordsSource:
         sub_records = RecordsFactory.create_instance(None, columns=column_values)
 
         if tilde_subscription is not None and tilde_subscription in grouped_records:
-            sub_records_ = grouped_records[tilde_subscription].clone()
-            sub_records.concat(sub_records_)
+            sub_records.concat(grouped_records[tilde_subscription])
 
         sub_records.drop_columns([COLUMN_NAME.TILDE_SUBSCRIPTION])
         return sub_records
@@ -1614,11 +1614,10 @@ class FilteredRecordsSource:
         sub_records = RecordsFactory.create_instance(None, columns=column_values)
 
         if inter_callback_object in grouped_records:
-            sub_records.concat(grouped_records[inter_callback_object].clone())
+            sub_records.concat(grouped_records[inter_callback_object])
 
         if intra_callback_object is not None and intra_callback_object in grouped_records:
-            intra_sub_records = grouped_records[intra_callback_object].clone()
-            sub_records.concat(intra_sub_records)
+            sub_records.concat(grouped_records[intra_callback_object])
             sub_records.sort(COLUMN_NAME.CALLBACK_START_TIMESTAMP)
 
         return sub_records
@@ -1748,8 +1747,7 @@ class FilteredRecordsSource:
             for publisher_handle in publisher_handles:
                 key = (intra_callback_object, publisher_handle)
                 if key in grouped_records:
-                    records_ = grouped_records[key].clone()
-                    records.concat(records_)
+                    records.concat(grouped_records[key])
         records.sort(COLUMN_NAME.RCLCPP_PUBLISH_TIMESTAMP)
 
         return records
@@ -1816,8 +1814,7 @@ class FilteredRecordsSource:
 
         for publisher_handle in publisher_handles:
             if publisher_handle in grouped_records:
-                inter_pub_records = grouped_records[publisher_handle].clone()
-                pub_records.concat(inter_pub_records)
+                pub_records.concat(grouped_records[publisher_handle])
 
         pub_records.sort(COLUMN_NAME.RCLCPP_PUBLISH_TIMESTAMP)
 
@@ -1862,8 +1859,7 @@ class FilteredRecordsSource:
 
         for tilde_publisher in tilde_publishers:
             if tilde_publisher in grouped_records:
-                tilde_records_ = grouped_records[tilde_publisher].clone()
-                tilde_records.concat(tilde_records_)
+                tilde_records.concat(grouped_records[tilde_publisher])
 
         tilde_records.drop_columns([COLUMN_NAME.TILDE_PUBLISHER])
         return tilde_records
@@ -1921,12 +1917,10 @@ class FilteredRecordsSource:
         )
 
         if inter_callback_object in records:
-            inter_callback_records = records[inter_callback_object].clone()
-            callback_records.concat(inter_callback_records)
+            callback_records.concat(records[inter_callback_object])
 
         if intra_callback_object is not None and intra_callback_object in records:
-            intra_callback_records = records[intra_callback_object].clone()
-            callback_records.concat(intra_callback_records)
+            callback_records.concat(records[intra_callback_object])
             callback_records.sort(COLUMN_NAME.CALLBACK_START_TIMESTAMP)
 
         return callback_records
@@ -1975,7 +1969,7 @@ class FilteredRecordsSource:
 
         for publisher_handle in publisher_handles:
             if publisher_handle in grouped_records:
-                records.concat(grouped_records[publisher_handle].clone())
+                records.concat(grouped_records[publisher_handle])
 
         records.sort(COLUMN_NAME.CALLBACK_START_TIMESTAMP)
 
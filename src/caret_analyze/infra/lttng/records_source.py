@@ -22,7 +22,6 @@ from .events_factory import EventsFactory
 from .lttng_info import LttngInfo
 from .ros2_tracing.data_model import Ros2DataModel
 from .value_objects import TimerCallbackValueLttng, TimerControl, TimerInit
-from ...common import Util
 from ...record import (Columns,
                        ColumnValue,
                        merge, merge_sequential,
@@ -227,12 +226,9 @@ class RecordsSource():
 
                 return records
 
-        timer_controls = self._info.get_timer_controls()
+        timer_controls = self._info.get_timer_controls(timer_callback.timer_handle)
 
-        filtered_timer_controls = Util.filter_items(
-            lambda x: x.timer_handle == timer_callback.timer_handle, timer_controls)
-
-        return TimerEventsFactory(filtered_timer_controls)
+        return TimerEventsFactory(timer_controls)
 
     @cached_property
     def tilde_publish_records(self) -> RecordsInterface:
@@ -145,10 +145,7 @@ class DataModelService:
         handle: int,
         middle_df: pd.DataFrame
     ) -> str | None:
-        def ns_and_node_name(row: pd.Series) -> str:
-            ns: str = row['namespace']
-            name: str = row['name']
-
+        def ns_and_node_name(ns: str, name: str) -> str:
             if ns[-1] == '/':
                 return ns + name
             else:
@@ -160,7 +157,11 @@ class DataModelService:
             match_nodes = self._data.nodes.df.loc[node_handles, :]
             match_nodes.drop_duplicates(
                 set(match_nodes) - {'tid'}, inplace=True, ignore_index=True)
-            node_names = [ns_and_node_name(row) for _, row in match_nodes.iterrows()]
+            node_names = [
+                ns_and_node_name(ns, name)
+                for ns, name in match_nodes[['namespace', 'name']].itertuples(
+                    index=False, name=None)
+            ]
             if len(node_names) > 1:
                 self._log_once(
                     logger,
@@ -205,7 +206,7 @@ class DataModelService:
     ) -> int | None:
         try:
             target_df = self._ensure_dataframe(
-                self._data.callback_objects.clone().df.reset_index()[
+                self._data.callback_objects.df.reset_index()[
                     ['reference', 'callback_object']
                 ])
             sub = target_df[target_df['callback_object'] == cb_addr]['reference'].values
@@ -227,7 +228,7 @@ class DataModelService:
     ) -> int | None:
         try:
             target_df = self._ensure_dataframe(
-                self._data.subscription_objects.clone().df.reset_index()[
+                self._data.subscription_objects.df.reset_index()[
                         ['subscription', 'subscription_handle']
                     ]
                 )
@@ -253,7 +254,7 @@ class DataModelService:
     ) -> int | None:
         try:
             target_df = self._ensure_dataframe(
-                self._data.subscriptions.clone().df.reset_index()[
+                self._data.subscriptions.df.reset_index()[
                     ['subscription_handle', 'rmw_handle']
                 ])
             rmw_handle = target_df[
@@ -598,7 +598,7 @@ class Ros2Handler():
     ) -> None:
         timestamp = get_field(event, '_timestamp')
         clock_offset = get_field(event, 'clock_offset')
-        if 'distribution' in event.keys():
+        if 'distribution' in event:
             distribution = get_field(event, 'distribution')
         else:
             distribution = 'NOTFOUND'
@@ -720,7 +720,7 @@ class Ros2Handler():
     ) -> None:
         if not self._is_valid_data(event):
             return
-        if 'publisher_handle' in event.keys():
+        if 'publisher_handle' in event:
             publisher_handle = get_field(event, 'publisher_handle')
             publisher_handle = \
                 self._remapper.publisher_handle_remapper.get_latest_object_id(
@@ -730,7 +730,7 @@ class Ros2Handler():
         timestamp = get_field(event, '_timestamp')
         message = get_field(event, 'message')
         tid = get_field(event, '_vtid')
-        if 'message_timestamp' in event.keys():
+        if 'message_timestamp' in event:
             message_timestamp = get_field(event, 'message_timestamp')
         else:
             message_timestamp = 0
@@ -779,7 +779,7 @@ class Ros2Handler():
         message = get_field(event, 'message')
         publisher_handle = get_field(event, 'publisher_handle')
         timestamp = get_field(event, '_timestamp')
-        if 'message_timestamp' in event.keys():
+        if 'message_timestamp' in event:
             message_timestamp = get_field(event, 'message_timestamp')
         else:
             message_timestamp = 0
@@ -141,6 +141,7 @@ class TracePointData:
 
         """
         self._df: pd.DataFrame = df.convert_dtypes()
+        self._is_converted = True
 
     @staticmethod
     def concat(
@@ -163,15 +164,15 @@ class TracePointData:
             concatenated data.
 
         """
-        concat_targets = []
+        column_names = list(columns)
+        concat_targets = [
+            data._converted_df().loc[:, column_names]
+            for data in trace_point_data
+            if set(column_names) <= set(data.columns)
+        ]
 
-        for data in trace_point_data:
-            has_columns = (set(data.columns) & set(columns)) == set(columns)
-            if not has_columns:
-                continue
-            concat_targets.append(data.df[list(columns)])
-
-        return TracePointData(pd.concat(concat_targets, axis=0).reset_index(drop=True))
+        return TracePointData(
+            pd.concat(concat_targets, axis=0, copy=False, ignore_index=True))
 
     def __len__(self) -> int:
         return len(self._df)
@@ -243,15 +244,51 @@ class TracePointData:
             column value for each row.
 
         """
-        df = deepcopy(self._df)
+        data = [f(row) for _, row in self._df.iterrows()]
+        self._df = self._df.assign(**{column: data})
+        self._is_converted = False
+
+    def add_vectorized_column(
+        self,
+        column: str,
+        f: Callable[[pd.DataFrame], Any]
+    ) -> None:
+        """
+        Add column computed from the whole data at once.
+
+        Parameters
+        ----------
+        column : str
+            column name to be added.
+        f : Callable[[pd.DataFrame], Any]
+            column values for all rows, or a scalar used for every row.
+
+        """
+        self._df = self._df.assign(**{column: f(self._df)})
+        self._is_converted = False
 
-        data = []
-        for i in range(len(df)):
-            row = df.iloc[i, :]
-            data.append(f(row))
-        df[column] = data
+    def add_group_order_column(
+        self,
+        column: str,
+        keys: list[str]
+    ) -> None:
+        """
+        Add column numbering rows within each group.
 
-        self._df = df
+        Rows are numbered from 0 in the current row order
+        for each combination of key column values.
+
+        Parameters
+        ----------
+        column : str
+            column name to be added.
+        keys : list[str]
+            column names used for grouping.
+
+        """
+        order = self._df.groupby(keys, sort=False, dropna=False).cumcount()
+        self._df = self._df.assign(**{column: order})
+        self._is_converted = False
 
     def remove_column(self, column: str) -> None:
         """
@@ -283,6 +320,7 @@ class TracePointData:
             filtered = self._df[self._df[column] == value]
 
         self._df = self._ensure_df(filtered)
+        self._is_converted = False
 
     def rename_column(self, old: str, new: str) -> None:
         """
@@ -354,7 +392,7 @@ class TracePointData:
             return df.drop(columns, axis=1)
 
         left_df = self._df
-        right_df = other.df
+        right_df = other._converted_df()
         if drop_columns:
             left_df = drop(left_df, drop_columns)
             right_df = drop(right_df, drop_columns)
@@ -366,13 +404,46 @@ class TracePointData:
             assert set(on) <= set(self.columns)
             assert set(on) <= set(other.columns)
 
-        self._df = pd.merge(
-            left_df,
-            right_df,
-            left_on=on,
-            right_on=on,
-            how=how  # type: ignore
-        )
+        if isinstance(on, str) and how in ['inner', 'left'] and \
+                self._is_lookup_table(left_df, right_df, on):
+            self._df = self._merge_by_map(left_df, right_df, on, how)
+        else:
+            self._df = pd.merge(
+                left_df,
+                right_df,
+                left_on=on,
+                right_on=on,
+                how=how  # type: ignore
+            )
+        self._is_converted = False
+
+    @staticmethod
+    def _is_lookup_table(left_df: pd.DataFrame, right_df: pd.DataFrame, on: str) -> bool:
+        # Mapping gives the same result as pd.merge only when every left row matches
+        # at most one right row and no columns other than the key collide.
+        right_key = right_df[on]
+        return len(right_df) > 0 and \
+            left_df[on].dtype == right_key.dtype and \
+            right_key.is_unique and \
+            not right_key.hasnans and \
+            len((set(left_df.columns) & set(right_df.columns)) - {on}) == 0
+
+    @staticmethod
+    def _merge_by_map(
+        left_df: pd.DataFrame,
+        right_df: pd.DataFrame,
+        on: str,
+        how: str
+    ) -> pd.DataFrame:
+        right_indexed = right_df.set_index(on)
+        if how == 'inner':
+            left_df = left_df[left_df[on].isin(right_indexed.index)]
+        keys = left_df[on]
+        df = left_df.assign(**{
+            column: keys.map(right_indexed[column])
+            for column in right_indexed.columns
+        })
+        return df.reset_index(drop=True)
 
     def set_columns(
         self,
@@ -390,10 +461,9 @@ class TracePointData:
             column names.
 
         """
-        df = self._df.copy()
-        for missing_column in set(columns) - set(self._df.columns):
-            df[missing_column] = pd.NA
-        self._df = df[columns]
+        if not set(columns) <= set(self._df.columns):
+            self._is_converted = False
+        self._df = self._df.reindex(columns=columns, fill_value=pd.NA)
 
     def drop_duplicate(self) -> None:
         """Remove duplicated rows."""
@@ -456,6 +526,7 @@ class TracePointData:
         """
         df = self._df.reset_index()
         self._df = df.convert_dtypes()
+        self._is_converted = True
 
     @property
     def df(self) -> pd.DataFrame:
@@ -467,8 +538,32 @@ class TracePointData:
         pd.DataFrame
             data
 
+        Note
+        ----
+        This returns a copy; modifying it does not change this instance.
+
+        """
+        return self._converted_df().copy()
+
+    def _converted_df(self) -> pd.DataFrame:
+        """
+        Return the internal data frame with dtypes converted.
+
+        Returns
+        -------
+        pd.DataFrame
+            data
+
+        Note
+        ----
+        dtypes are converted at most once after each modification,
+        and the returned frame is shared between calls. Do not modify it.
+
         """
-        return self._ensure_df(self._df.convert_dtypes())
+        if not self._is_converted:
+            self._df = self._ensure_df(self._df.convert_dtypes())
+            self._is_converted = True
+        return self._df
 
     @staticmethod
     def _ensure_df(data) -> pd.DataFrame:
@@ -136,8 +136,8 @@ class Frequency:
         if converter:
             base_timestamp = round(converter.convert(base_timestamp))
             until_timestamp = round(converter.convert(until_timestamp))
-            convert_vector = np.vectorize(converter.convert)
-            timestamp_array = np.round(convert_vector(timestamp_array)).astype(np.int64)
+            timestamp_array = np.round(
+                converter.convert_array(timestamp_array)).astype(np.int64)
 
         timestamp_array = timestamp_array[timestamp_array >= base_timestamp]
         if len(timestamp_array) == 0:
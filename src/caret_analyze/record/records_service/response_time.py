@@ -16,6 +16,8 @@ from __future__ import annotations
 
 from collections.abc import Iterator, Sequence
 
+from operator import itemgetter
+
 from warnings import warn
 
 from ..column import ColumnValue
@@ -261,11 +263,19 @@ class ResponseMapAll:
         self._end_timestamps: list[int] = []
         self._records: list[RecordInterface] = []
 
+        # Records are visited in reverse, so entries are appended and the
+        # lists are reversed afterwards instead of inserting at the head.
+        start_ts_to_idx: dict[int, int] = {}
+
+        # End timestamps are only ever replaced by smaller values,
+        # so the minimum can be tracked while iterating.
+        min_end_ts: int | None = None
+
         for record in reversed(records.data):
             if self._end_column in record.columns:
                 end_ts = record.get(self._end_column)
-            elif len(self._end_timestamps) > 0:
-                end_ts = min(self._end_timestamps)
+            elif min_end_ts is not None:
+                end_ts = min_end_ts
             else:
                 continue
 
@@ -276,19 +286,26 @@ class ResponseMapAll:
             if self._has_reversed_timestamp(record):
                 continue
 
-            if start_ts not in self._start_timestamps:
-                self._start_timestamps.insert(0, start_ts)
-                self._end_timestamps.insert(0, end_ts)
-                self._records.insert(0, record)
-            else:
-                idx = self._start_timestamps.index(start_ts)
-                if end_ts < self._end_timestamps[idx]:
-                    self._end_timestamps[idx] = end_ts
-                    self._records[idx] = record
+            idx = start_ts_to_idx.get(start_ts)
+            if idx is None:
+                start_ts_to_idx[start_ts] = len(self._start_timestamps)
+                self._start_timestamps.append(start_ts)
+                self._end_timestamps.append(end_ts)
+                self._records.append(record)
+            elif end_ts < self._end_timestamps[idx]:
+                self._end_timestamps[idx] = end_ts
+                self._records[idx] = record
 
-        min_end_timestamp_idx = [
-            i for i, v in enumerate(self._end_timestamps) if v == min(self._end_timestamps)
-            ]
+            if min_end_ts is None or end_ts < min_end_ts:
+                min_end_ts = end_ts
+
+        self._start_timestamps.reverse()
+        self._end_timestamps.reverse()
+        self._records.reverse()
+
+        min_end_timestamp_idx = {
+            i for i, v in enumerate(self._end_timestamps) if v == min_end_ts
+            }
 
         self._start_timestamps = [
             v for i, v in enumerate(self._start_timestamps) if i not in min_end_timestamp_idx
@@ -320,25 +337,26 @@ class ResponseMapAll:
 
         end_timestamps: list[int] = []
         start_timestamps: list[int] = []
+        end_ts_to_idx: dict[int, int] = {}
         worst_to_best_timestamps: list[int] = []
         for start_ts, end_ts, prev_start_ts in zip(self._start_timestamps[1:],
                                                    self._end_timestamps[1:],
                                                    self._start_timestamps[:-1]):
-            if end_ts not in end_timestamps:
+            idx = end_ts_to_idx.get(end_ts)
+            if idx is None:
+                end_ts_to_idx[end_ts] = len(end_timestamps)
                 start_timestamps.append(start_ts)
                 end_timestamps.append(end_ts)
                 worst_to_best_timestamps.append(start_ts - prev_start_ts)
-            else:
-                idx = end_timestamps.index(end_ts)
-                if start_ts < start_timestamps[idx]:
-                    start_timestamps[idx] = start_ts
-                    worst_to_best_timestamps[idx] = start_ts - prev_start_ts
+            elif start_ts < start_timestamps[idx]:
+                start_timestamps[idx] = start_ts
+                worst_to_best_timestamps[idx] = start_ts - prev_start_ts
 
         records = self._create_empty_records()
         for start_ts, end_ts, worst_to_best_ts in sorted(zip(start_timestamps,
                                                              end_timestamps,
                                                              worst_to_best_timestamps),
-                                                         key=lambda x: x[0]):
+                                                         key=itemgetter(0)):
             if converter:
                 record = {
                     self._start_column: round(
@@ -361,18 +379,19 @@ class ResponseMapAll:
 
         end_timestamps: list[int] = []
         start_timestamps: list[int] = []
+        end_ts_to_idx: dict[int, int] = {}
         for start_ts, end_ts in zip(self._start_timestamps, self._end_timestamps):
 
-            if end_ts not in end_timestamps:
+            idx = end_ts_to_idx.get(end_ts)
+            if idx is None:
+                end_ts_to_idx[end_ts] = len(end_timestamps)
                 start_timestamps.append(start_ts)
                 end_timestamps.append(end_ts)
-            else:
-                idx = end_timestamps.index(end_ts)
-                if start_ts > start_timestamps[idx]:
-                    start_timestamps[idx] = start_ts
+            elif start_ts > start_timestamps[idx]:
+                start_timestamps[idx] = start_ts
 
         records = self._create_empty_records()
-        for start_ts, end_ts in sorted(zip(start_timestamps, end_timestamps), key=lambda x: x[0]):
+        for start_ts, end_ts in sorted(zip(start_timestamps, end_timestamps), key=itemgetter(0)):
             if converter:
                 record = {
                     self._start_column: round(converter.convert(start_ts)),
@@ -414,17 +433,18 @@ class ResponseMapAll:
     ) -> RecordsInterface:
         end_timestamps: list[int] = []
         start_timestamps: list[int] = []
+        end_ts_to_idx: dict[int, int] = {}
         for start_ts, end_ts in zip(self._start_timestamps, self._end_timestamps):
-            if end_ts not in end_timestamps:
+            idx = end_ts_to_idx.get(end_ts)
+            if idx is None:
+                end_ts_to_idx[end_ts] = len(end_timestamps)
                 start_timestamps.append(start_ts)
                 end_timestamps.append(end_ts)
-            else:
-                idx = end_timestamps.index(end_ts)
-                if start_ts < start_timestamps[idx]:
-                    start_timestamps[idx] = start_ts
+            elif start_ts < start_timestamps[idx]:
+                start_timestamps[idx] = start_ts
 
         records = self._create_empty_records()
-        for start_ts, end_ts in sorted(zip(start_timestamps, end_timestamps), key=lambda x: x[0]):
+        for start_ts, end_ts in sorted(zip(start_timestamps, end_timestamps), key=itemgetter(0)):
             if converter:
                 record = {
                     self._start_column: round(converter.convert(start_ts)),
@@ -450,7 +470,7 @@ class ResponseMapAll:
             elif end_ts is None:
                 continue
 
-            if end_ts in end_column_record_dict.keys():
+            if end_ts in end_column_record_dict:
                 end_column_record_dict[end_ts].insert(0, record)
             else:
                 end_column_record_dict[end_ts] = [record]
@@ -492,7 +512,7 @@ class ResponseMapAll:
             elif end_ts is None:
                 continue
 
-            if end_ts in end_column_record_dict.keys():
+            if end_ts in end_column_record_dict:
                 end_column_record_dict[end_ts].append(record)
             else:
                 end_column_record_dict[end_ts] = [record]
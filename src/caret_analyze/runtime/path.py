@@ -61,11 +61,11 @@ class ColumnMerger():
         """
         key = column_name
 
-        if key == records.columns[0] and len(self._count) > 0 and key in self._count.keys():
+        if key == records.columns[0] and len(self._count) > 0 and key in self._count:
             count = max(self._count.get(key, 0) - 1, 0)
             return self._to_column_name(count, key)
 
-        if key not in self._count.keys():
+        if key not in self._count:
             self._count[key] = 0
 
         column_name = self._to_column_name(self._count[key], key)
@@ -427,7 +427,7 @@ class Path(PathBase, Summarizable):
 
         """
         if (self._include_first_callback, self._include_last_callback) \
-                not in self.__records_cache.keys():
+                not in self.__records_cache:
             try:
                 self.__records_cache[(self._include_first_callback, self._include_last_callback)] \
                     = self._to_records_core()
@@ -437,7 +437,7 @@ class Path(PathBase, Summarizable):
                     = RecordsFactory.create_instance()
 
         assert (self._include_first_callback, self._include_last_callback) \
-            in self.__records_cache.keys()
+            in self.__records_cache
         return self.__records_cache[(self._include_first_callback,
                                      self._include_last_callback)].clone()
 
@@ -15,7 +15,6 @@
 from __future__ import annotations
 
 from abc import ABCMeta, abstractmethod
-from copy import deepcopy
 from logging import getLogger
 
 import math
@@ -88,7 +87,7 @@ class PathBase(metaclass=ABCMeta):
             column names
 
         """
-        return deepcopy(self.to_records().columns)
+        return list(self.to_records().columns)
 
     def to_dataframe(
         self,
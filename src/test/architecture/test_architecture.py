@@ -360,6 +360,10 @@ class TestArchitecture:
         path = arch.search_paths('start_node', 'end_node')
         assert path == [path_mock.to_value()]
 
+        arch.search_paths('start_node', 'end_node', max_paths=1)
+        searcher_mock.search.assert_called_with(
+            'start_node', 'end_node', max_node_depth=15, max_paths=1)
+
     def test_search_paths_three_nodes(self, mocker):
         reader_mock = mocker.Mock(spec=ArchitectureReader)
         loaded_mock = mocker.Mock(spec=ArchitectureLoaded)
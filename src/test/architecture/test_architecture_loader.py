@@ -814,6 +814,32 @@ class TestPublishersLoaded:
         assert pub_struct_info.node_name == publisher_info.node_name
         assert pub_struct_info.topic_name == publisher_info.topic_name
 
+    def test_bind_callbacks_by_topic(self, mocker):
+        reader_mock = mocker.Mock(spec=ArchitectureReader)
+        publisher_info = PublisherValue(
+            'topic_name', 'node_name', 'node_id', None, 0
+        )
+        mocker.patch.object(reader_mock, 'get_publishers',
+                            return_value=[publisher_info])
+        callbacks_loaded_mock = mocker.Mock(spec=CallbacksLoaded)
+
+        callback_struct_mock = mocker.Mock(spec=CallbackStruct)
+        mocker.patch.object(callback_struct_mock, 'publish_topics',
+                            [PublishTopicInfoValue('topic_name', 0),
+                             PublishTopicInfoValue('topic_name', 1)])
+        callback_struct_mock_ = mocker.Mock(spec=CallbackStruct)
+        mocker.patch.object(callback_struct_mock_, 'publish_topics',
+                            [PublishTopicInfoValue('topic_name_', 0)])
+
+        mocker.patch.object(callbacks_loaded_mock, 'data',
+                            [callback_struct_mock_, callback_struct_mock])
+        node = NodeValue('node_name', 'node_id')
+        loaded = PublishersLoaded(
+            reader_mock, callbacks_loaded_mock, node)
+
+        assert len(loaded.data) == 1
+        assert loaded.data[0].callbacks == [callback_struct_mock]
+
 
 class TestSubscriptionsLoaded:
 
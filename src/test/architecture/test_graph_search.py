@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from copy import deepcopy
+
 from caret_analyze.architecture.architecture import \
     DEFAULT_MAX_CALLBACK_CONSTRUCTION_ORDER_ON_PATH_SEARCHING
 from caret_analyze.architecture.graph_search import (CallbackPathSearcher,
@@ -26,7 +28,7 @@ from caret_analyze.architecture.struct import (CallbackStruct,
                                                PathStruct,
                                                PublisherStruct, SubscriptionStruct,
                                                VariablePassingStruct)
-from caret_analyze.exceptions import ItemNotFoundError
+from caret_analyze.exceptions import ItemNotFoundError, MultipleItemFoundError
 from caret_analyze.value_objects import (CommunicationStructValue,
                                          NodePathStructValue)
 
@@ -68,6 +70,18 @@ class TestGraphPath:
         assert len(path) == 1
         assert nodes == path.nodes
 
+    def test_deepcopy(self):
+        node_0 = GraphNode('/node0/callback0')
+        node_1 = GraphNode('/node1/callback1')
+        path = GraphPath([GraphEdge(node_0, node_1)])
+
+        path_ = deepcopy(path)
+        assert isinstance(path_, GraphPath)
+        assert path_ == path
+        assert path_ is not path
+        path_.append(GraphEdge(node_1, node_0))
+        assert len(path) == 1
+
 
 class TestGraphCore:
 
@@ -189,6 +203,63 @@ class TestGraphCore:
             ] in r
         assert [GraphEdgeCore(0, 1), GraphEdgeCore(1, 3)] in r
 
+    def test_search_dead_end_case(self):
+        g = GraphCore()
+
+        g.add_edge(0, 1)
+        g.add_edge(1, 2)
+        g.add_edge(0, 3)
+        g.add_edge(3, 4)
+        g.add_edge(4, 3)
+
+        r = g.search_paths(0, 2)
+        assert r == [[GraphEdgeCore(0, 1), GraphEdgeCore(1, 2)]]
+
+        r = g.search_paths(3, 2)
+        assert r == []
+
+    def test_search_after_add_edge(self):
+        g = GraphCore()
+
+        g.add_edge(0, 1)
+        g.add_edge(2, 3)
+
+        r = g.search_paths(0, 3)
+        assert r == []
+
+        g.add_edge(1, 2)
+
+        r = g.search_paths(0, 3)
+        assert r == [[GraphEdgeCore(0, 1), GraphEdgeCore(1, 2), GraphEdgeCore(2, 3)]]
+
+    def test_iter_paths(self):
+        g = GraphCore()
+
+        g.add_edge(0, 1)
+        g.add_edge(0, 2)
+        g.add_edge(1, 3)
+        g.add_edge(2, 3)
+
+        it = g.iter_paths(0, 3)
+        assert next(it) == [GraphEdgeCore(0, 2), GraphEdgeCore(2, 3)]
+        assert list(it) == [[GraphEdgeCore(0, 1), GraphEdgeCore(1, 3)]]
+
+        assert list(g.iter_paths(0, 3)) == g.search_paths(0, 3)
+
+    def test_search_max_paths(self):
+        g = GraphCore()
+
+        g.add_edge(0, 1)
+        g.add_edge(0, 2)
+        g.add_edge(1, 3)
+        g.add_edge(2, 3)
+
+        r = g.search_paths(0, 3, max_paths=1)
+        assert r == [[GraphEdgeCore(0, 2), GraphEdgeCore(2, 3)]]
+
+        r = g.search_paths(0, 3, max_paths=3)
+        assert len(r) == 2
+
     # def test_measure_performance(self):
     #     num = 5000
     #     g = GraphCore()
@@ -366,6 +437,25 @@ class TestGraph:
         assert [
             GraphEdge(node_0, node_1), GraphEdge(node_1, node_3)] in r
 
+    def test_iter_paths_multi_nodes(self):
+        g = Graph()
+        node_0 = GraphNode('0')
+        node_1 = GraphNode('1')
+        node_2 = GraphNode('2')
+
+        g.add_edge(node_0, node_1, 'a')
+        g.add_edge(node_0, node_1, 'b')
+        g.add_edge(node_1, node_2)
+
+        r = list(g.iter_paths(node_0, node_1, node_2))
+        assert r == g.search_paths(node_0, node_1, node_2)
+        assert len(r) == 2
+        assert [GraphEdge(node_0, node_1, 'a'), GraphEdge(node_1, node_2)] in r
+        assert [GraphEdge(node_0, node_1, 'b'), GraphEdge(node_1, node_2)] in r
+
+        with pytest.raises(ItemNotFoundError):
+            g.iter_paths(node_0, GraphNode('3'))
+
 
 class TestCallbackPathSearcher:
 
@@ -641,7 +731,7 @@ class TestNodePathSearcher:
 
         assert paths == [path_mock]
         assert graph_mock.search_paths.call_args == (
-            (src_node, dst_node), {'max_depth': 0})
+            (src_node, dst_node), {'max_depth': 0, 'max_paths': None})
 
     def test_to_path(self, mocker):
         node_name = '/node'
@@ -1106,6 +1196,30 @@ class TestNodePathSearcher:
         with pytest.raises(ItemNotFoundError):
             searcher._find_node_path('0->1', '1->2', '0', 1, 0)
 
+    def test_find_node(self, mocker):
+        node_mock_1 = mocker.Mock(spec=NodeStruct)
+        node_mock_2 = mocker.Mock(spec=NodeStruct)
+        node_mock_3 = mocker.Mock(spec=NodeStruct)
+        mocker.patch.object(node_mock_1, 'node_name', '0')
+        mocker.patch.object(node_mock_1, 'paths', [])
+        mocker.patch.object(node_mock_2, 'node_name', '1')
+        mocker.patch.object(node_mock_2, 'paths', [])
+        mocker.patch.object(node_mock_3, 'node_name', '1')
+        mocker.patch.object(node_mock_3, 'paths', [])
+
+        searcher = NodePathSearcher(
+            (node_mock_1, node_mock_2, node_mock_3),
+            (),
+            DEFAULT_MAX_CALLBACK_CONSTRUCTION_ORDER_ON_PATH_SEARCHING
+        )
+        assert searcher._find_node('0') == node_mock_1
+
+        with pytest.raises(ItemNotFoundError):
+            searcher._find_node('2')
+
+        with pytest.raises(MultipleItemFoundError):
+            searcher._find_node('1')
+
     def test_max_callback_construction_order(self, mocker):
         graph_mock = mocker.Mock(spec=Graph)
         mocker.patch('caret_analyze.architecture.graph_search.Graph', return_value=graph_mock)
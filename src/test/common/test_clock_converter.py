@@ -15,6 +15,7 @@
 from caret_analyze.common import ClockConverter
 from caret_analyze.exceptions import InvalidArgumentError
 
+import numpy as np
 import pytest
 
 
@@ -33,6 +34,12 @@ class TestClockConverter:
         assert converter.convert(0) == 1
         assert converter.convert(1) == 2
 
+    def test_convert_array(self):
+        converter = ClockConverter(2, 1)
+        times = np.array([0, 1, 10], dtype=np.int64)
+        converted = converter.convert_array(times)
+        assert converted.tolist() == [converter.convert(t) for t in [0, 1, 10]]
+
     def test_create_from_series(self):
         converter = ClockConverter.create_from_series([0, 1], [1, 1])
         e = 1.0e-10
@@ -92,6 +92,44 @@ class TestEventCounter:
         df = EventCounter._build_count_df(data)
         assert list(df['size']) == [1] * len(df)
 
+    def test_get_count_observed_groups_only(self):
+        data = Ros2DataModel()
+        data.add_node(0, 1, 0, 0, 'node', '/')
+        data.add_timer_node_link(10, 0, 1)
+        data.add_callback_object(10, 0, 100)
+        data.add_callback_start_instance(0, 0, 100, False)
+        data.finalize()
+
+        counter = EventCounter(data, validate=False)
+        count_df = counter._count_df
+        assert count_df['node_name'].dtype == 'category'
+
+        grouped = counter.get_count(['node_name', 'trace_point'])
+        assert len(grouped) == len(count_df.drop_duplicates(['node_name', 'trace_point']))
+        assert grouped.loc[('/node', 'ros2:callback_start'), 'size'] == 1
+
+        grouped.loc[('/node', 'ros2:callback_start'), 'size'] = 0
+        grouped = counter.get_count(['node_name', 'trace_point'])
+        assert grouped.loc[('/node', 'ros2:callback_start'), 'size'] == 1
+
+    def test_get_count_index_dtype(self):
+        data = Ros2DataModel()
+        data.add_node(0, 1, 0, 0, 'node', '/')
+        data.add_timer_node_link(10, 0, 1)
+        data.add_callback_object(10, 0, 100)
+        data.add_callback_start_instance(0, 0, 100, False)
+        data.finalize()
+
+        counter = EventCounter(data, validate=False)
+
+        grouped = counter.get_count(['node_name', 'trace_point'])
+        assert all(level.dtype == object for level in grouped.index.levels)
+        assert grouped.reset_index()['node_name'].dtype == object
+
+        grouped = counter.get_count(['trace_point'])
+        assert grouped.index.dtype == object
+        assert grouped.reset_index()['trace_point'].dtype == object
+
     def test_validation_without_ld_preload(
         self,
         mocker,
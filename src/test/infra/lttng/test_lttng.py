@@ -3156,11 +3156,13 @@ def set_pickle_collection_time_range(mocker):
 def set_ctf_collection_time_range(mocker):
     def _set_ctf_collection_time_range(time_min: int, time_max: int):
         ctf_collection_mock = mocker.Mock(spec=IterableEvents)
-        mocker.patch('caret_analyze.infra.lttng.lttng.CtfEventCollection',
-                     return_value=ctf_collection_mock)
+        ctf_collection_cls_mock = mocker.patch(
+            'caret_analyze.infra.lttng.lttng.CtfEventCollection',
+            return_value=ctf_collection_mock)
 
         mocker.patch.object(
             ctf_collection_mock, 'time_range', return_value=(time_min, time_max))
+        ctf_collection_cls_mock.read_begin_time.return_value = time_min
     return _set_ctf_collection_time_range
 
 
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from caret_analyze.exceptions import InvalidArgumentError
 from caret_analyze.infra.lttng.lttng_info import (DataFrameFormatted,
                                                   LttngInfo)
 from caret_analyze.infra.lttng.ros2_tracing.data_model import Ros2DataModel
@@ -23,7 +24,7 @@ from caret_analyze.infra.lttng.value_objects import (CallbackGroupValueLttng,
                                                      TimerCallbackValueLttng)
 from caret_analyze.infra.trace_point_data import TracePointData
 from caret_analyze.value_objects import (CallbackGroupType, ExecutorType,
-                                         ExecutorValue)
+                                         ExecutorValue, Qos)
 
 from caret_analyze.value_objects.node import NodeValue
 from caret_analyze.value_objects.service import ServiceValue
@@ -179,6 +180,44 @@ class TestLttngInfo:
         pubs_info = info.get_publishers(NodeValue('/node_', 'node_id_'))
         assert len(pubs_info) == 0
 
+    def test_get_publisher_qos(self, mocker):
+        data = Ros2DataModel()
+
+        formatted_mock = mocker.Mock(spec=DataFrameFormatted)
+        mocker.patch('caret_analyze.infra.lttng.lttng_info.DataFrameFormatted',
+                     return_value=formatted_mock)
+
+        pub = TracePointData(pd.DataFrame.from_dict(
+            [
+                {
+                    'publisher_handle': 9,
+                    'node_handle': 3,
+                    'topic_name': '/topic_name',
+                    'depth': 5,
+                    'construction_order': 0
+                },
+                {
+                    'publisher_handle': 10,
+                    'node_handle': 3,
+                    'topic_name': '/topic_name_',
+                    'depth': 1,
+                    'construction_order': 0
+                }
+            ]
+        ))
+        mocker.patch.object(formatted_mock, 'publishers', pub)
+
+        data.finalize()
+        info = LttngInfo(data)
+
+        pub_mock = mocker.Mock(spec=PublisherValueLttng)
+        mocker.patch.object(pub_mock, 'publisher_handle', 10)
+        assert info.get_publisher_qos(pub_mock) == Qos(1)
+
+        mocker.patch.object(pub_mock, 'publisher_handle', 11)
+        with pytest.raises(InvalidArgumentError):
+            info.get_publisher_qos(pub_mock)
+
     def test_get_subscriptions_info(self, mocker):
         data = Ros2DataModel()
 
@@ -921,6 +960,44 @@ class TestLttngInfo:
         times_info = info.get_timers(NodeValue('/node_', 'node_id_'))
         assert len(times_info) == 0
 
+    def test_get_timer_controls(self, mocker):
+        data = Ros2DataModel()
+
+        formatted_mock = mocker.Mock(spec=DataFrameFormatted)
+        mocker.patch('caret_analyze.infra.lttng.lttng_info.DataFrameFormatted',
+                     return_value=formatted_mock)
+
+        timer_controls = TracePointData(pd.DataFrame.from_dict(
+            [
+                {
+                    'timestamp': 1,
+                    'timer_handle': 9,
+                    'type': 'init',
+                    'params': {'period': 100},
+                },
+                {
+                    'timestamp': 2,
+                    'timer_handle': 10,
+                    'type': 'init',
+                    'params': {'period': 200},
+                },
+            ]
+        ))
+        mocker.patch.object(formatted_mock, 'timer_controls', timer_controls)
+
+        data.finalize()
+        info = LttngInfo(data)
+
+        controls = info.get_timer_controls()
+        assert [(c.timer_handle, c.timestamp, c.period_ns) for c in controls] == \
+            [(9, 1, 100), (10, 2, 200)]
+
+        controls = info.get_timer_controls(10)
+        assert len(controls) == 1
+        assert controls[0].period_ns == 200
+
+        assert info.get_timer_controls(11) == []
+
 
 class TestDataFrameFormatted:
 
@@ -1036,7 +1113,8 @@ class TestDataFrameFormatted:
 
         data.finalize()
 
-        mocker.patch.object(DataFrameFormatted, '_is_ignored_subscription', return_value=False)
+        mocker.patch.object(
+            DataFrameFormatted, '_get_ignored_subscription_handles', return_value=set())
 
         sub = DataFrameFormatted._build_sub_callbacks(data)
 
@@ -1197,7 +1275,8 @@ class TestDataFrameFormatted:
 
         data.finalize()
 
-        mocker.patch.object(DataFrameFormatted, '_is_ignored_subscription', return_value=False)
+        mocker.patch.object(
+            DataFrameFormatted, '_get_ignored_subscription_handles', return_value=set())
 
         sub = DataFrameFormatted._format_subscription_callback_object(data)
 
@@ -1216,6 +1295,21 @@ class TestDataFrameFormatted:
         ).convert_dtypes()
         assert sub.df.equals(expect)
 
+    def test_get_ignored_subscription_handles(self):
+        data = Ros2DataModel()
+
+        data.add_node(
+            node_handle=1, timestamp=0, tid=0, rmw_handle=2, name='rviz2', namespace='/')
+        data.add_node(
+            node_handle=3, timestamp=0, tid=0, rmw_handle=4, name='node', namespace='/')
+        data.add_rcl_subscription(5, 0, 1, 6, '/topic', 1)
+        data.add_rcl_subscription(7, 0, 3, 8, '/parameter_events', 1)
+        data.add_rcl_subscription(9, 0, 3, 10, '/topic', 1)
+        data.finalize()
+
+        ignored = DataFrameFormatted._get_ignored_subscription_handles(data)
+        assert ignored == {5, 7}
+
     def test_build_nodes_df(self):
         data = Ros2DataModel()
 
@@ -1287,6 +1381,29 @@ class TestDataFrameFormatted:
 
         assert cbg_humble.df.equals(cbg_jazzy.df)
 
+    def test_build_callback_groups_df_with_multiple_executors(self):
+        group_type = 'reentrant'
+        cbg_addr = 3
+        exec_addrs = [4, 5]
+
+        data = Ros2DataModel()
+        data.add_caret_init(0, 0, 'humble')
+        data.add_callback_group(exec_addrs[0], 0, cbg_addr, group_type)
+        data.add_callback_group(exec_addrs[1], 1, cbg_addr, group_type)
+        data.finalize()
+
+        cbg = DataFrameFormatted._build_cbg(data)
+
+        expect = pd.DataFrame.from_dict(
+            [{
+                'callback_group_id': f'callback_group_{cbg_addr}',
+                'callback_group_addr': cbg_addr,
+                'group_type_name': group_type,
+                'executor_addr': exec_addrs[1],
+            }]
+        ).convert_dtypes()
+        assert cbg.df.reset_index(drop=True).equals(expect)
+
     def test_build_publisher_df(self):
         pub_handle = 1
         node_handle = 2
@@ -1373,6 +1490,18 @@ class TestDataFrameFormatted:
         assert formatted.services == srv_mock
         assert formatted.timers == tim_mock
 
+    def test_build_on_first_access(self, mocker, create_trace_point_data):
+        exec_mock = create_trace_point_data()
+        build_mock = mocker.patch.object(
+            DataFrameFormatted, '_build_executor', return_value=exec_mock)
+        data_mock = mocker.Mock(spec=Ros2DataModel)
+        formatted = DataFrameFormatted(data_mock)
+        assert build_mock.call_count == 0
+
+        assert formatted.executor == exec_mock
+        assert formatted.executor == exec_mock
+        build_mock.assert_called_once_with(data_mock)
+
     def test_tilde_subscription(self, mocker):
         data = Ros2DataModel()
         data.finalize()
@@ -329,6 +329,26 @@ class TestRecordsProviderLttng:
 
         assert provider.is_intra_process_communication(comm_info_mock) is True
 
+    def test_communication_records(self, mocker):
+        lttng_mock = mocker.Mock(spec=Lttng)
+        data_model_mock = mocker.Mock(spec=Ros2DataModel)
+        lttng_mock.data = data_model_mock
+        provider = RecordsProviderLttng(lttng_mock)
+        comm_info_mock = mocker.Mock(spec=CommunicationStructValue)
+
+        intra_records = RecordsCppImpl()
+        inter_records = RecordsCppImpl([RecordCppImpl()])
+        intra_mock = mocker.patch.object(
+            provider, '_compose_intra_proc_comm_records', return_value=intra_records)
+        mocker.patch.object(
+            provider, '_compose_inter_proc_comm_records', return_value=inter_records)
+
+        assert provider.communication_records(comm_info_mock) == inter_records
+
+        intra_records.concat(RecordsCppImpl([RecordCppImpl()]))
+        assert provider.communication_records(comm_info_mock) == intra_records
+        assert intra_mock.call_count == 2
+
     def test_path_beginning_records(self, mocker):
 
         records_mock = mocker.Mock(spec=RecordsInterface)
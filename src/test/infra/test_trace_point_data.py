@@ -0,0 +1,39 @@
+# Copyright 2021 TIER IV, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from caret_analyze.infra.trace_point_data import TracePointData
+
+import pandas as pd
+
+
+class TestTracePointData:
+
+    def test_df_returns_copy(self):
+        data = TracePointData(pd.DataFrame({'a': [1, 2], 'b': ['x', 'y']}))
+
+        df = data.df
+        df.loc[0, 'a'] = 10
+        df['c'] = [3, 4]
+        df.drop(index=1, inplace=True)
+
+        df_after = data.df
+        assert list(df_after.columns) == ['a', 'b']
+        assert df_after['a'].tolist() == [1, 2]
+        assert df_after['b'].tolist() == ['x', 'y']
+
+    def test_df_converts_dtypes_once(self):
+        data = TracePointData(pd.DataFrame({'a': [1, 2]}))
+
+        assert data.df['a'].dtype == 'Int64'
+        assert data._converted_df() is data._converted_df()